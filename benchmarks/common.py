@@ -0,0 +1,47 @@
+# benchmarks, shared configuration
+
+import argparse
+import logging
+
+from pyfc4.models import *
+
+# repository configuration, as for tests and console
+from tests.localsettings import *
+
+# quiet pyfc4 debug logging while timing
+logging.disable(logging.CRITICAL)
+
+
+def parser(description):
+
+	'''
+	Argument parser for benchmark, with repository root and credentials defaulting to tests/localsettings.py
+
+	Args:
+		description (str): description of benchmark
+
+	Returns:
+		(argparse.ArgumentParser)
+	'''
+
+	parser = argparse.ArgumentParser(description=description)
+	parser.add_argument('--root', default=REPO_ROOT, help='repository root, defaults to REPO_ROOT of tests/localsettings.py')
+	parser.add_argument('--username', default=REPO_USERNAME)
+	parser.add_argument('--password', default=REPO_PASSWORD)
+	return parser
+
+
+def repository(args, **kwargs):
+
+	'''
+	Repository for benchmark
+
+	Args:
+		args (argparse.Namespace): parsed arguments
+		kwargs: passed to Repository
+
+	Returns:
+		(Repository)
+	'''
+
+	return Repository(args.root, args.username, args.password, **kwargs)
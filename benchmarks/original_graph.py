@@ -0,0 +1,65 @@
+'''
+Memory allocated, and time taken, retrieving a resource and parsing its graph, for 1,000, 10,000, and 100,000 triples,
+measured with tracemalloc, as reported in docs/performance.md, "Original graph".
+
+Resources are created under bench_original_graph/ with --setup, which only needs to be run once.  To compare with
+an earlier version, check it out and run the same command.
+
+	python -m benchmarks.original_graph --setup
+	python -m benchmarks.original_graph
+'''
+
+import gc
+import time
+import tracemalloc
+
+from benchmarks.common import *
+
+
+def setup(repo, sizes):
+
+	# (re)create resources with n triples, over 50 predicates
+	for n in sizes:
+		uri = 'bench_original_graph/%s' % n
+		existing = repo.get_resource(uri)
+		if existing:
+			existing.delete(remove_tombstone=True)
+		resource = BasicContainer(repo, uri)
+		for i in range(n):
+			resource.rdf.graph.add((resource.uri, rdflib.URIRef('http://example.org/p%s' % (i % 50)), rdflib.Literal('value %s' % i)))
+		resource.create(specify_uri=True, auto_refresh=False)
+		print('created %s, %s triples' % (uri, n))
+
+
+def measure(repo, sizes):
+
+	print('| triples in resource | retained | peak | ms |')
+	print('|---|---|---|---|')
+	for n in sizes:
+		gc.collect()
+		tracemalloc.start()
+		stime = time.time()
+
+		# retrieve, and parse graph, which may be lazy
+		resource = repo.get_resource('bench_original_graph/%s' % n)
+		assert len(resource.rdf.graph) >= n
+		elapsed = time.time() - stime
+		current, peak = tracemalloc.get_traced_memory()
+		tracemalloc.stop()
+		print('| {:,} | {:.1f}MB | {:.1f}MB | {:.0f} |'.format(n, current / 1e6, peak / 1e6, elapsed * 1000))
+		del resource
+
+
+if __name__ == '__main__':
+
+	parser = parser(__doc__.strip().split('\n')[0])
+	parser.add_argument('--setup', action='store_true', help='create resources to retrieve')
+	parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+	args = parser.parse_args()
+
+	# n-triples, as measured in docs/performance.md
+	repo = repository(args, default_serialization='application/n-triples')
+	if args.setup:
+		setup(repo, args.sizes)
+	else:
+		measure(repo, args.sizes)
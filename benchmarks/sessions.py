@@ -0,0 +1,51 @@
+'''
+Requests per second, and new connections opened, retrieving the description of a resource with a new session per
+request, and with the pooled session of the repository, as reported in docs/performance.md, "Sessions / Connection pooling".
+
+	python -m benchmarks.sessions --requests 500
+'''
+
+import time
+
+import requests
+
+from benchmarks.common import *
+
+
+def new_connections(session):
+
+	# connections opened by pools of session adapters
+	pools = [ adapter.poolmanager.pools for adapter in session.adapters.values() ]
+	return sum(pool_container[key].num_connections for pool_container in pools for key in pool_container.keys())
+
+
+if __name__ == '__main__':
+
+	parser = parser(__doc__.strip().split('\n')[0])
+	parser.add_argument('--requests', type=int, default=500)
+	args = parser.parse_args()
+
+	repo = repository(args)
+	resource = BasicContainer(repo, 'bench_sessions')
+	if not repo.get_resource(resource.uri):
+		resource.create(specify_uri=True, auto_refresh=False)
+	uri = '%s/fcr:metadata' % resource.uri
+
+	print('| | requests/sec | new connections |')
+	print('|---|---|---|')
+
+	# new session per request, as before pooling
+	stime = time.time()
+	for i in range(args.requests):
+		with requests.Session() as session:
+			session.get(uri, auth=(args.username, args.password))
+	elapsed = time.time() - stime
+	print('| new session per request | {:.0f} | {} |'.format(args.requests / elapsed, args.requests))
+
+	# pooled session, excluding connection opened by setup
+	opened = new_connections(repo.session)
+	stime = time.time()
+	for i in range(args.requests):
+		repo.api.http_request('GET', uri)
+	elapsed = time.time() - stime
+	print('| pooled session | {:.0f} | {} |'.format(args.requests / elapsed, new_connections(repo.session) - opened))
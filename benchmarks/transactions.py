@@ -0,0 +1,33 @@
+'''
+Time taken constructing a Transaction, and starting and committing a transaction, as reported in docs/performance.md,
+"Transactions".
+
+	python -m benchmarks.transactions
+'''
+
+import time
+import timeit
+
+from benchmarks.common import *
+
+
+if __name__ == '__main__':
+
+	parser = parser(__doc__.strip().split('\n')[0])
+	parser.add_argument('--constructions', type=int, default=2000)
+	parser.add_argument('--cycles', type=int, default=200)
+	args = parser.parse_args()
+
+	repo = repository(args)
+
+	# constructing Transaction, without requests
+	elapsed = timeit.timeit(lambda: Transaction(repo, 'bench', '%stx:bench' % repo.root, auto_keep_alive=False), number=args.constructions)
+	print('constructing Transaction: {:.1f}us'.format(elapsed / args.constructions * 1e6))
+
+	# start_txn and commit
+	stime = time.time()
+	for i in range(args.cycles):
+		txn = repo.start_txn()
+		txn.commit()
+	elapsed = time.time() - stime
+	print('repo.start_txn() and txn.commit(): {:.2f}ms'.format(elapsed / args.cycles * 1000))
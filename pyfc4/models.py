@@ -1,16 +1,28 @@
 # pyfc4
 
+import asyncio
+from collections import deque, OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import copy
 import datetime
+import email.utils
+import functools
+import hashlib
 import io
 import json
+import os
 import pdb
 import rdflib
+import rdflib.store
 from rdflib.compare import to_isomorphic, graph_diff
 import requests
+import shutil
+import tempfile
+import threading
 import time
 from types import SimpleNamespace
 import uuid
+import weakref
 
 # logging
 import logging
@@ -33,9 +45,24 @@ class Repository(object):
 		default_serialization (str): mimetype of default Accept and Content-Type headers
 		default_auto_refresh (bool): if False, resource create/update, and graph modifications
 			will not retrieve or parse updates automatically.  Dramatically improves performance.
+		custom_resource_type_parser (callable): optional, function that returns resource type from GET response
+		pool_connections (int): number of per-host connection pools to cache in the HTTP session
+		pool_maxsize (int): maximum number of connections kept alive per host
+		pool_block (bool): if True, requests wait for a free connection when pool_maxsize is reached,
+			otherwise an additional, non-pooled, connection is opened
+		keep_alive (bool): if False, sends "Connection: close" and does not reuse connections
+		session (requests.Session): optional, pre-built session to use, e.g. shared from another Repository.
+			Sessions passed in are not closed by self.close()
+		cache (bool): if True, cache parsed graphs of retrieved resources, revalidated with ETag / Last-Modified
+		cache_max_triples (int): maximum number of triples held by cache, least recently used evicted first
+		cache_ttl (int): seconds after which cached graphs are evicted, regardless of use
+		binary_cache (BinaryCache): optional, on-disk cache of binary data, keyed by repository digest
 
 	Attributes:
 		context (dict): Default dictionary of namespace prefixes and namespace URIs
+		resource_type_cache_size (int): maximum number of URIs for which resource types, not available
+			from GET response headers, are remembered
+		delete_stats (types.SimpleNamespace): statistics of last self.delete_many(), with resources deleted, requests, elapsed, and rate
 	'''
 
 	context = {
@@ -58,6 +85,15 @@ class Repository(object):
 		'ore':'http://www.openarchives.org/ore/terms/'
 	}
 
+	resource_type_cache_size = 10000
+
+	# preferences for triples that can be omitted from resources, see get_resource(omit=[...])
+	omit_preferences = {
+		'containment':'http://www.w3.org/ns/ldp#PreferContainment',
+		'membership':'http://www.w3.org/ns/ldp#PreferMembership',
+		'server_managed':'http://fedora.info/definitions/v4/repository#ServerManaged'
+	}
+
 	def __init__(self,
 			root,
 			username,
@@ -65,7 +101,16 @@ class Repository(object):
 			context = None,
 			default_serialization = 'application/rdf+xml',
 			default_auto_refresh = False,
-			custom_resource_type_parser = None
+			custom_resource_type_parser = None,
+			pool_connections = 10,
+			pool_maxsize = 10,
+			pool_block = False,
+			keep_alive = True,
+			session = None,
+			cache = False,
+			cache_max_triples = 100000,
+			cache_ttl = 300,
+			binary_cache = None
 		):
 
 		# handle root path
@@ -84,6 +129,14 @@ class Repository(object):
 		# API facade
 		self.api = API(self)
 
+		# HTTP session, with pooled connections reused for all requests
+		if session:
+			self.session = session
+			self._owns_session = False
+		else:
+			self.session = self._build_session(pool_connections, pool_maxsize, pool_block, keep_alive)
+			self._owns_session = True
+
 		# instantiate namespace_manager
 		self.namespace_manager = rdflib.namespace.NamespaceManager(rdflib.Graph())
 		for ns_prefix, ns_uri in self.context.items():
@@ -97,9 +150,86 @@ class Repository(object):
 		# container for transactions
 		self.txns = {}
 
+		# statistics of last delete_many()
+		self.delete_stats = None
+
 		# optional, custom resource type parser
 		self.custom_resource_type_parser = custom_resource_type_parser
 
+		# URI to resource type cache, for types not resolvable from GET response
+		self._resource_type_cache = OrderedDict()
+		self._resource_type_cache_lock = threading.Lock()
+
+		# optional, cache of parsed graphs for retrieved resources
+		if cache:
+			self.cache = ResponseCache(max_triples=cache_max_triples, ttl=cache_ttl)
+		else:
+			self.cache = None
+
+		# optional, on-disk cache of binary data
+		self.binary_cache = binary_cache
+
+
+	def __enter__(self):
+		return self
+
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+
+	def _build_session(self, pool_connections, pool_maxsize, pool_block, keep_alive):
+
+		'''
+		Build requests.Session with pooled HTTP adapters mounted for http and https.
+		Connections are kept alive and reused across requests, and across threads.
+
+		Args:
+			pool_connections (int): number of per-host connection pools to cache
+			pool_maxsize (int): maximum number of connections kept alive per host
+			pool_block (bool): if True, block when no free connection is available
+			keep_alive (bool): if False, set "Connection: close" header for all requests
+
+		Returns:
+			(requests.Session)
+		'''
+
+		session = requests.Session()
+		session.auth = (self.username, self.password)
+
+		# mount pooled adapters
+		adapter = requests.adapters.HTTPAdapter(
+			pool_connections=pool_connections,
+			pool_maxsize=pool_maxsize,
+			pool_block=pool_block)
+		session.mount('http://', adapter)
+		session.mount('https://', adapter)
+
+		# optionally, disable keep-alive
+		if not keep_alive:
+			session.headers['Connection'] = 'close'
+
+		return session
+
+
+	def close(self):
+
+		'''
+		Close HTTP session and release pooled connections.
+		Sessions shared with this repository, e.g. a Transaction using the session of its Repository,
+		are left open.
+
+		Args:
+			None
+
+		Returns:
+			None
+		'''
+
+		if self._owns_session:
+			logger.debug('closing HTTP session for %s' % self.root)
+			self.session.close()
+
 
 	def parse_uri(self, uri=None):
 
@@ -158,7 +288,7 @@ class Repository(object):
 			raise TypeError("expecting Resource type, such as BasicContainer or NonRDFSource")
 
 
-	def get_resource(self, uri, resource_type=None, response_format=None):
+	def get_resource(self, uri, resource_type=None, response_format=None, embed_children=False, omit=None):
 
 		'''
 		Retrieve resource:
@@ -166,13 +296,19 @@ class Repository(object):
 			- If 200, continues, 404, returns False, otherwise raises Exception
 			- Parse resource type
 				- If custom resource type parser provided, this fires
-				- Else, or if custom parser misses, fire HEAD request and parse LDP resource type from Link header
+				- Else, or if custom parser misses, parse LDP resource type from Link header of GET response
+				- If Link header is inconclusive, use previously resolved type for URI, or rdf:type triples of payload
+				- Finally, fire HEAD request and parse LDP resource type from Link header
 			- Return instantiated pyfc4 resource
 
 		Args:
 			uri (rdflib.term.URIRef,str): input URI
 			resource_type (): resource class e.g. BasicContainer, NonRDFSource, or extensions thereof
 			response_format (str): expects mimetype / Content-Type header such as 'application/rdf+xml', 'text/turtle', etc.
+			embed_children (bool): if True, request children embedded in the response, and split into resources
+				available from resource.children(as_resources=True) without further requests
+			omit (list): triples to omit from response, any of 'containment', 'membership', 'server_managed',
+				returning a partial view of resource that can still be updated
 
 		Returns:
 			Resource
@@ -185,12 +321,37 @@ class Repository(object):
 		if uri.toPython().endswith('/fcr:metadata'):
 			uri = rdflib.term.URIRef(uri.toPython().rstrip('/fcr:metadata'))
 
+		# if cached, revalidate with conditional GET
+		if not response_format:
+			response_format = self.default_serialization
+		cached = None
+		headers = None
+		if self.cache and not embed_children and not omit:
+			cached = self.cache.get(uri, response_format)
+			if cached:
+				headers = dict(cached.validators)
+
+		# request children embedded in response, or triples omitted
+		if embed_children or omit:
+			headers = {'Prefer':self._build_prefer_header(embed_children, omit)}
+
 		# fire GET request
 		get_response = self.api.http_request(
 			'GET',
 			"%s/fcr:metadata" % uri,
+			headers=headers,
 			response_format=response_format)
 
+		# 304, cached resource unchanged, instantiate from cached response and graph
+		if get_response.status_code == 304 and cached:
+			self.cache.hit(uri, response_format)
+			if not resource_type:
+				resource_type = cached.resource_type
+			logger.debug('resource uri %s not modified, using cached graph' % uri)
+			return resource_type(self,
+				uri,
+				response=self.cache.copy_response(cached.response))
+
 		# 404, item does not exist, return False
 		if get_response.status_code == 404:
 			logger.debug('resource uri %s not found, returning False' % uri)
@@ -201,31 +362,735 @@ class Repository(object):
 
 			# if resource_type not provided
 			if not resource_type:
-
-				# if custom resource type parser affixed to repo instance, fire
-				if self.custom_resource_type_parser:
-					logger.debug("custom resource type parser provided, attempting")
-					resource_type = self.custom_resource_type_parser(self, uri, get_response)
-
-				# parse LDP resource type from headers if custom resource parser misses,
-				# or not provided
-				if not resource_type:
-					# Issue HEAD request to get LDP resource type from URI proper, not /fcr:metadata
-					head_response = self.api.http_request('HEAD', uri)
-					resource_type = self.api.parse_resource_type(head_response)
+				resource_type = self._parse_resource_type(uri, get_response)
 
 			logger.debug('using resource type: %s' % resource_type)
 
-			# return resource
-			return resource_type(self,
+			# instantiate resource
+			resource = resource_type(self,
 				uri,
 				response=get_response)
 
+			# note omitted triples for partial view
+			if omit:
+				resource.omit = list(omit)
+
+			# split embedded children from graph
+			if embed_children:
+				self._split_embedded_resources(resource)
+
+			# cache parsed graph
+			elif self.cache and not omit:
+				self.cache.miss()
+				self.cache.put(uri, response_format, get_response, resource.rdf.graph, resource_type)
+
+			# return resource
+			return resource
+
 		else:
 			raise Exception('HTTP %s, error retrieving resource uri %s' % (get_response.status_code, uri))
 
 
-	def start_txn(self, txn_name=None):
+	def _build_prefer_header(self, embed_children=False, omit=None):
+
+		'''
+		Build Prefer header for representation with embedded children, or omitted triples
+
+		Args:
+			embed_children (bool): if True, include EmbedResources
+			omit (list): any of 'containment', 'membership', 'server_managed'
+
+		Returns:
+			(str): Prefer header
+		'''
+
+		prefer = 'return=representation'
+		if embed_children:
+			prefer += '; include="http://fedora.info/definitions/v4/repository#EmbedResources"'
+		if omit:
+			for omit_preference in omit:
+				if omit_preference not in self.omit_preferences:
+					raise Exception('cannot omit %s, expecting one of %s' % (omit_preference, list(self.omit_preferences.keys())))
+			prefer += '; omit="%s"' % ' '.join([ self.omit_preferences[omit_preference] for omit_preference in omit ])
+		return prefer
+
+
+	def _split_embedded_resources(self, resource):
+
+		'''
+		Split payload of resource retrieved with embedded children into graphs for the resource and each child,
+		by subject, including hash URIs of each, and instantiate children as resources from their graphs.
+
+		Types of children are determined by custom resource type parser, if provided, previously resolved types,
+		or their rdf:type triples, and only if inconclusive is the child retrieved with an additional request.
+
+		Args:
+			resource (Resource): resource retrieved with embedded children
+
+		Returns:
+			None: sets resource._embedded_children
+		'''
+
+		graph = self.api.parse_rdf_payload(resource.data, resource.headers)
+		ns_bindings = list(graph.namespaces())
+		def empty_graph():
+			empty = rdflib.Graph()
+			for ns_prefix, ns_uri in ns_bindings:
+				empty.bind(ns_prefix, ns_uri, override=False)
+			return empty
+
+		# split triples by subject
+		children = list(graph.objects(resource.uri, rdflib.term.URIRef('http://www.w3.org/ns/ldp#contains')))
+		child_graphs = { child:empty_graph() for child in children }
+		resource_graph = empty_graph()
+		for s,p,o in graph:
+			subject = rdflib.term.URIRef(s.split('#')[0]) if isinstance(s, rdflib.term.URIRef) else s
+			if subject in child_graphs:
+				child_graphs[subject].add((s,p,o))
+			else:
+				resource_graph.add((s,p,o))
+
+		# set graph of resource to own triples, parsed on first access of resource.rdf
+		resource.response.graph = resource_graph
+		resource._rdf = None
+
+		# instantiate children
+		resource._embedded_children = []
+		for child in children:
+			child_graph = child_graphs[child]
+			child_response = requests.models.Response()
+			child_response.status_code = 200
+			child_response.url = str(child)
+			child_response.headers = requests.structures.CaseInsensitiveDict({'Content-Type':'application/n-triples'})
+			child_response._content = b''
+			child_response.graph = child_graph
+
+			# determine resource type
+			resource_type = None
+			if self.custom_resource_type_parser:
+				child_response._content = child_graph.serialize(format='nt', encoding='utf-8')
+				resource_type = self.custom_resource_type_parser(self, child, child_response)
+			if not resource_type:
+				resource_type = self._get_cached_resource_type(child)
+			if not resource_type:
+				resource_type = self.api.parse_resource_type_from_triples(child, child_graph)
+				if not resource_type and (child, rdflib.RDF.type, rdflib.term.URIRef('http://www.w3.org/ns/ldp#Container')) in child_graph:
+					resource_type = BasicContainer
+				if resource_type:
+					self._cache_resource_type(child, resource_type)
+
+			# if type not determined, retrieve child
+			if resource_type:
+				resource._embedded_children.append(resource_type(self, child, response=child_response))
+			else:
+				logger.debug('could not determine resource type of embedded child %s, retrieving' % child)
+				resource._embedded_children.append(self.get_resource(child))
+
+
+	def get_resources(self, uris, max_workers=10, ordered=True, resource_type=None, response_format=None):
+
+		'''
+		Retrieve many resources concurrently, issuing GET requests from a pool of worker threads over the pooled session.
+
+		Resources are yielded as they are retrieved, with at most 2 * max_workers requests queued or in flight,
+		such that long lists of URIs are not all retrieved into memory at once.  Errors are reported per URI,
+		and do not abort the remaining retrievals.
+
+		Args:
+			uris (iterable): input URIs
+			max_workers (int): number of concurrent requests, should not exceed pool_maxsize of repository
+			ordered (bool): if True, yield in order of uris, else in order retrieved
+			resource_type (): resource class passed to get_resource, e.g. BasicContainer, NonRDFSource, or extensions thereof
+			response_format (str): expects mimetype / Content-Type header such as 'application/rdf+xml', 'text/turtle', etc.
+
+		Yields:
+			(tuple): (uri, resource), where resource is Resource, False if not found, or Exception raised while retrieving
+		'''
+
+		def get(uri):
+			try:
+				return self.get_resource(uri, resource_type=resource_type, response_format=response_format)
+			except Exception as e:
+				logger.debug('error retrieving resource uri %s: %s' % (uri, e))
+				return e
+
+		uris = iter(uris)
+		window = max_workers * 2
+		executor = ThreadPoolExecutor(max_workers=max_workers)
+		pending = deque() if ordered else {}
+
+		def submit():
+			for uri in uris:
+				future = executor.submit(get, uri)
+				if ordered:
+					pending.append((uri, future))
+				else:
+					pending[future] = uri
+				if len(pending) >= window:
+					break
+
+		try:
+			submit()
+			while pending:
+
+				# yield next in order of uris
+				if ordered:
+					uri, future = pending.popleft()
+					resource = future.result()
+					submit()
+					yield uri, resource
+
+				# yield any retrieved
+				else:
+					done, not_done = wait(list(pending), return_when=FIRST_COMPLETED)
+					retrieved = [ (pending.pop(future), future.result()) for future in done ]
+					submit()
+					for uri, resource in retrieved:
+						yield uri, resource
+
+		# cancel queued requests if generator closed early
+		finally:
+			futures = [ future for uri, future in pending ] if ordered else list(pending)
+			for future in futures:
+				future.cancel()
+			executor.shutdown(wait=True)
+
+
+	def walk(self, root=None, max_depth=None, concurrency=10, filter=None, max_queued=1000):
+
+		'''
+		Breadth-first crawl of resources beneath root, following ldp:contains, retrieving resources concurrently.
+
+		Yields a lightweight record for each resource as it is retrieved, and does not retain resources once yielded.
+		At most 2 * concurrency requests are queued or in flight.  Children waiting to be retrieved are pulled from
+		the parents they were listed by, kept in a queue, as workers become free.  Once more than max_queued parents are
+		waiting, children of the most recently retrieved parents are retrieved first, such that the queue stays bounded
+		by max_queued, plus parents along the path being descended, rather than growing with the width of the tree.
+
+		Args:
+			root (rdflib.term.URIRef,str): input URI to start from, defaults to repository root
+			max_depth (int): depth beneath root to descend, where root is depth 0, defaults to None for all
+			concurrency (int): number of concurrent requests, should not exceed pool_maxsize of repository
+			filter (callable): called with each record, if returns False, record is not yielded nor descended into
+			max_queued (int): number of parents with children waiting, beyond which the crawl descends rather than widens
+
+		Yields:
+			(types.SimpleNamespace): record with uri, parent, depth, exists, resource_type, children as list of URIs, error if raised,
+				and queued as number of parents with children waiting
+		'''
+
+		def visit(uri, parent, depth):
+			record = SimpleNamespace(uri=uri, parent=parent, depth=depth, exists=False, resource_type=None, children=[], error=None, queued=None)
+			try:
+				resource = self.get_resource(uri)
+				if resource:
+					record.exists = True
+					record.resource_type = type(resource)
+					record.children = resource.children()
+
+			except Exception as e:
+				logger.debug('error retrieving resource uri %s: %s' % (uri, e))
+				record.error = e
+			return record
+
+		# parents with children waiting, as iterators over children
+		queue = deque([(iter([self.parse_uri(root)]), None, 0)])
+		window = concurrency * 2
+		executor = ThreadPoolExecutor(max_workers=concurrency)
+		pending = {}
+
+		try:
+			while queue or pending:
+
+				# submit from queue, up to window, from oldest parent, or newest if more than max_queued parents waiting
+				while queue and len(pending) < window:
+					breadth_first = len(queue) <= max_queued
+					children, parent, depth = queue[0] if breadth_first else queue[-1]
+					uri = next(children, None)
+					if uri is None:
+						if breadth_first:
+							queue.popleft()
+						else:
+							queue.pop()
+						continue
+					pending[executor.submit(visit, uri, parent, depth)] = uri
+
+				# yield records as retrieved, queue children
+				done, not_done = wait(list(pending), return_when=FIRST_COMPLETED)
+				for future in done:
+					del pending[future]
+					record = future.result()
+					if filter and not filter(record):
+						continue
+					if record.children and (max_depth is None or record.depth < max_depth):
+						queue.append((iter(record.children), record.uri, record.depth + 1))
+					record.queued = len(queue)
+					yield record
+
+		# cancel queued requests if generator closed early
+		finally:
+			for future in pending:
+				future.cancel()
+			executor.shutdown(wait=True)
+
+
+	def create_many(self, resources, max_workers=10, use_txn=False, ignore_tombstone=False, auto_refresh=None):
+
+		'''
+		Create many resources concurrently, at their specified URIs, issuing PUT requests from a pool of worker threads over the pooled session.
+
+		Resources are ordered by URI path, such that each resource is created only after the nearest ancestor
+		also being created, while resources independent of one another are created concurrently.  If creating
+		a resource fails, resources beneath it are not attempted.  Errors are reported per resource, and do not
+		abort the remaining creations.
+
+		If use_txn, resources are bound to a new transaction, as if instantiated with it, and created there.  The transaction
+		is committed if all resources were created, rebinding resources to the repository, and rolled back otherwise,
+		rebinding resources to the repository as not existing.  use_txn is not supported on a Transaction, as Fedora does not
+		nest transactions.
+
+		Args:
+			resources (list): resources to create, e.g. BasicContainer, NonRDFSource, or extensions thereof, instantiated with URIs
+			max_workers (int): number of concurrent requests, should not exceed pool_maxsize of repository
+			use_txn (bool): if True, create all resources in a transaction
+			ignore_tombstone (bool): If True, will attempt creation, if tombstone exists (409), will delete tombstone and retry
+			auto_refresh (bool): If True, refreshes resources after creation. If left None, defaults to repo.default_auto_refresh
+
+		Returns:
+			(list): report for each resource, in order of resources, with uri, resource, parent, created, error if raised, and elapsed seconds
+		'''
+
+		if use_txn and isinstance(self, Transaction):
+			raise Exception('cannot create resources in a new transaction from transaction %s, transactions do not nest' % self.root)
+
+		# report for each resource, indexed by URI
+		report = []
+		index = {}
+		for resource in resources:
+			uri = str(resource.uri).rstrip('/')
+			if uri in index:
+				raise Exception('resource %s provided more than once' % uri)
+			if use_txn and not uri.startswith(self.root):
+				raise Exception('resource %s is not within repository %s' % (uri, self.root))
+			index[uri] = SimpleNamespace(uri=resource.uri, resource=resource, parent=None, created=False, error=None, elapsed=None)
+			report.append(index[uri])
+
+		# determine parent of each resource, the nearest ancestor being created, and children thereof
+		children = { uri:[] for uri in index }
+		roots = deque()
+		for uri, result in index.items():
+			ancestor = self._nearest_ancestor(uri, index)
+			if ancestor:
+				result.parent = index[ancestor].uri
+				children[ancestor].append(uri)
+			else:
+				roots.append(uri)
+
+		# create in transaction, with resources bound to it, and translated to repository URIs on commit
+		if use_txn:
+			txn = self.start_txn(auto_keep_alive=True)
+			if txn is None:
+				raise Exception('could not start transaction at %sfcr:tx to create resources, none were created' % self.root)
+			for result in report:
+				result.resource._translate_uris(txn, txn.to_txn_uri)
+			refresh = False
+		else:
+			refresh = auto_refresh
+
+		def create(uri):
+			result = index[uri]
+			stime = time.time()
+			try:
+				result.resource.create(specify_uri=True, ignore_tombstone=ignore_tombstone, auto_refresh=refresh)
+				result.created = True
+			except Exception as e:
+				logger.debug('error creating resource uri %s: %s' % (uri, e))
+				result.error = e
+			result.elapsed = time.time() - stime
+			return uri
+
+		def skip(uri):
+			for child in children[uri]:
+				index[child].error = Exception('parent %s was not created' % index[uri].uri)
+				skip(child)
+
+		executor = ThreadPoolExecutor(max_workers=max_workers)
+		pending = set()
+		try:
+			while roots or pending:
+
+				# submit resources whose parents are created
+				while roots:
+					pending.add(executor.submit(create, roots.popleft()))
+
+				# as created, queue children, else skip them
+				done, pending = wait(pending, return_when=FIRST_COMPLETED)
+				for future in done:
+					uri = future.result()
+					if index[uri].created:
+						roots.extend(children[uri])
+					else:
+						skip(uri)
+		finally:
+			executor.shutdown(wait=True)
+
+		# close transaction, resources bound to repository on commit, or as not existing on rollback
+		if use_txn:
+			if all([ result.created for result in report ]):
+				txn.commit()
+				created = [ result.resource for result in report ]
+				for resource in created:
+					self._invalidate_uri(resource.uri)
+
+				# refresh, now at repository URIs
+				if auto_refresh or (auto_refresh == None and self.default_auto_refresh):
+					with ThreadPoolExecutor(max_workers=max_workers) as executor:
+						list(executor.map(lambda resource: resource.refresh(), created))
+			else:
+				txn.rollback()
+				for result in report:
+					result.resource._translate_uris(self, txn.to_canonical_uri)
+					if result.created:
+						result.resource.exists = False
+						result.created = False
+						result.error = Exception('transaction rolled back')
+
+		return report
+
+
+	def sharded_ingest(self, resources, shards=4, max_workers=1, retries=1, ignore_tombstone=False, auto_refresh=None):
+
+		'''
+		Create many resources across concurrent transactions, or shards, each committed, or rolled back, independently.
+
+		Resources are partitioned by URI path, such that a resource and all resources beneath it being created fall
+		in the same shard, and shards are balanced by number of resources.  Each shard is created with
+		self.create_many(use_txn=True), from its own worker thread, and a shard rolled back is retried up to retries times.
+
+		Args:
+			resources (list): resources to create, e.g. BasicContainer, NonRDFSource, or extensions thereof, instantiated with URIs
+			shards (int): number of concurrent transactions
+			max_workers (int): number of concurrent requests within each shard
+			retries (int): number of times to retry a shard rolled back
+			ignore_tombstone (bool): If True, will attempt creation, if tombstone exists (409), will delete tombstone and retry
+			auto_refresh (bool): If True, refreshes resources after commit. If left None, defaults to repo.default_auto_refresh
+
+		Returns:
+			(list): report for each shard, with shard number, resources, committed, attempts, elapsed seconds, rate as resources created per second,
+				and report from self.create_many() of last attempt
+		'''
+
+		# group resources by nearest ancestor without ancestors, being created
+		index = { str(resource.uri).rstrip('/'):resource for resource in resources }
+		if len(index) != len(resources):
+			raise Exception('resources provided more than once')
+		groups = OrderedDict()
+		for key, resource in index.items():
+			root = key
+			ancestor = self._nearest_ancestor(root, index)
+			while ancestor:
+				root = ancestor
+				ancestor = self._nearest_ancestor(root, index)
+			groups.setdefault(root, []).append(resource)
+
+		# assign largest groups first, to shard with fewest resources
+		report = [ SimpleNamespace(shard=x, resources=[], committed=False, attempts=0, elapsed=None, rate=None, report=None) for x in range(shards) ]
+		for group in sorted(groups.values(), key=len, reverse=True):
+			min(report, key=lambda shard: len(shard.resources)).resources.extend(group)
+		report = [ shard for shard in report if shard.resources ]
+
+		def ingest(shard):
+			stime = time.time()
+			while not shard.committed and shard.attempts <= retries:
+				shard.attempts += 1
+				try:
+					shard.report = self.create_many(shard.resources, max_workers=max_workers, use_txn=True, ignore_tombstone=ignore_tombstone, auto_refresh=auto_refresh)
+					shard.committed = all([ result.created for result in shard.report ])
+				except Exception as e:
+					logger.debug('error ingesting shard %s: %s' % (shard.shard, e))
+				if not shard.committed:
+					logger.debug('shard %s rolled back, attempt %s of %s' % (shard.shard, shard.attempts, retries + 1))
+			shard.elapsed = time.time() - stime
+			created = len(shard.resources) if shard.committed else 0
+			shard.rate = created / shard.elapsed if shard.elapsed else None
+			logger.debug('shard %s, %s resources created in %.3f seconds' % (shard.shard, created, shard.elapsed))
+
+		with ThreadPoolExecutor(max_workers=len(report) or 1) as executor:
+			list(executor.map(ingest, report))
+		return report
+
+
+	def delete_many(self, uris, remove_tombstone=True, max_workers=10):
+
+		'''
+		Delete many resources concurrently, issuing DELETE requests, and tombstone removals, from a pool of worker threads over the pooled session.
+
+		As deleting a resource deletes all resources beneath it, URIs beneath another URI being deleted are not deleted individually,
+		nor checked for existence, but reported as covered by that ancestor, and not as deleted.  Errors are reported per URI,
+		including tombstones that could not be removed, and do not abort the remaining deletions.  Throughput is recorded at
+		self.delete_stats.
+
+		Args:
+			uris (iterable): input URIs
+			remove_tombstone (bool): If True, will remove tombstone at uri/fcr:tombstone when removing resource
+			max_workers (int): number of concurrent requests, should not exceed pool_maxsize of repository
+
+		Returns:
+			(list): report for each URI, in order of uris, with uri, deleted, covered by ancestor URI, error if raised, and elapsed seconds
+		'''
+
+		# report for each URI, indexed by URI
+		report = []
+		index = {}
+		for uri in uris:
+			uri = self.parse_uri(uri)
+			result = index.setdefault(str(uri).rstrip('/'), SimpleNamespace(uri=uri, deleted=False, covered=None, error=None, elapsed=None))
+			report.append(result)
+
+		# delete only URIs without ancestors also being deleted
+		targets = []
+		for key, result in index.items():
+			ancestor = self._nearest_ancestor(key, index)
+			if ancestor:
+				result.covered = index[ancestor].uri
+			else:
+				targets.append(result)
+
+		def delete(result):
+			stime = time.time()
+			try:
+				response = self.api.http_request('DELETE', result.uri)
+				if response.status_code == 204:
+					result.deleted = True
+					self._invalidate_uri(result.uri)
+					if remove_tombstone:
+						tombstone_response = self.api.http_request('DELETE', '%s/fcr:tombstone' % result.uri)
+						if tombstone_response.status_code != 204:
+							raise Exception('HTTP %s, could not remove tombstone for resource %s' % (tombstone_response.status_code, result.uri))
+				elif response.status_code not in [404, 410]:
+					raise Exception('HTTP %s, could not delete resource %s' % (response.status_code, result.uri))
+			except Exception as e:
+				logger.debug('error deleting resource uri %s: %s' % (result.uri, e))
+				result.error = e
+			result.elapsed = time.time() - stime
+
+		stime = time.time()
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			list(executor.map(delete, targets))
+		elapsed = time.time() - stime
+
+		# resources deleted, not including those covered by ancestors, which may not have existed
+		deleted = len([ result for result in targets if result.deleted ])
+		self.delete_stats = SimpleNamespace(
+			resources=deleted,
+			requests=len(targets),
+			elapsed=elapsed,
+			rate=deleted / elapsed if elapsed else None)
+		logger.debug('deleted %s resources, with %s requests, in %.3f seconds' % (deleted, len(targets), elapsed))
+		return report
+
+
+	def _nearest_ancestor(self, uri, uris):
+
+		'''
+		Return nearest ancestor of URI, by path, found in uris
+
+		Args:
+			uri (str): uri of resource, without trailing slash
+			uris (dict,set): URIs, without trailing slashes
+
+		Returns:
+			(str): ancestor URI, or None
+		'''
+
+		while '/' in uri and uri != self.root.rstrip('/'):
+			uri = uri.rsplit('/', 1)[0]
+			if uri in uris:
+				return uri
+		return None
+
+
+	def flush(self, resources, max_workers=10, auto_refresh=None, update_binary=True):
+
+		'''
+		Update many modified resources concurrently, issuing PATCH requests from a pool of worker threads over the pooled session.
+
+		Resources without local changes, per resource.dirty, are skipped without diffing graphs or sending requests.
+		Errors are reported per resource, and do not abort the remaining updates.
+
+		Args:
+			resources (iterable): resources to update
+			max_workers (int): number of concurrent requests, should not exceed pool_maxsize of repository
+			auto_refresh (bool): If True, refreshes resources after update. If left None, defaults to repo.default_auto_refresh
+			update_binary (bool): If True, and resource is NonRDF, updates binary data as well
+
+		Returns:
+			(list): report for each resource, in order of resources, with uri, resource, updated, skipped, error if raised, and elapsed seconds
+		'''
+
+		def update(result):
+			stime = time.time()
+			try:
+				if not result.resource.exists:
+					raise Exception('resource %s does not exist, create before updating' % result.uri)
+				if not result.resource.dirty:
+					result.skipped = True
+				else:
+					result.resource.update(auto_refresh=auto_refresh, update_binary=update_binary)
+					result.updated = True
+			except Exception as e:
+				logger.debug('error updating resource uri %s: %s' % (result.uri, e))
+				result.error = e
+			result.elapsed = time.time() - stime
+
+		report = [ SimpleNamespace(uri=resource.uri, resource=resource, updated=False, skipped=False, error=None, elapsed=None) for resource in resources ]
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			list(executor.map(update, report))
+		return report
+
+
+	def _retrieve_resources(self, uris):
+
+		'''
+		Retrieve list of resources with self.get_resources, in order, raising the first error encountered
+
+		Args:
+			uris (list): input URIs
+
+		Returns:
+			(list): list of resources
+		'''
+
+		resources = []
+		for uri, resource in self.get_resources(uris):
+			if isinstance(resource, Exception):
+				raise resource
+			resources.append(resource)
+		return resources
+
+
+	def _parse_resource_type(self, uri, get_response):
+
+		'''
+		Determine resource type for GET response, issuing a HEAD request only as a last resort
+
+		Args:
+			uri (rdflib.term.URIRef): uri of resource
+			get_response (requests.models.Response): response from GET request to uri/fcr:metadata
+
+		Returns:
+			[NonRDFSource, BasicContainer, DirectContainer, IndirectContainer], or type from custom resource type parser
+		'''
+
+		resource_type = None
+
+		# if custom resource type parser affixed to repo instance, fire
+		if self.custom_resource_type_parser:
+			logger.debug("custom resource type parser provided, attempting")
+			resource_type = self.custom_resource_type_parser(self, uri, get_response)
+			if resource_type:
+				return resource_type
+
+		# parse LDP resource type from Link headers of GET response
+		resource_type = self.api.parse_resource_type(get_response)
+		if resource_type:
+			return resource_type
+
+		# previously resolved for this URI
+		resource_type = self._get_cached_resource_type(uri)
+		if resource_type:
+			logger.debug('using cached resource type for %s' % uri)
+			return resource_type
+
+		# parse LDP resource type from rdf:type triples of GET response
+		resource_type = self.api.parse_resource_type_from_graph(uri, get_response)
+
+		# Issue HEAD request to get LDP resource type from URI proper, not /fcr:metadata
+		if not resource_type:
+			head_response = self.api.http_request('HEAD', uri)
+			resource_type = self.api.parse_resource_type(head_response)
+
+		# remember for this URI
+		if resource_type:
+			self._cache_resource_type(uri, resource_type)
+		return resource_type
+
+
+	def _get_cached_resource_type(self, uri):
+
+		'''
+		Return cached resource type for URI, or None
+
+		Args:
+			uri (rdflib.term.URIRef,str): uri of resource
+
+		Returns:
+			resource type or None
+		'''
+
+		with self._resource_type_cache_lock:
+			resource_type = self._resource_type_cache.get(str(uri))
+			if resource_type:
+				self._resource_type_cache.move_to_end(str(uri))
+			return resource_type
+
+
+	def _cache_resource_type(self, uri, resource_type):
+
+		'''
+		Cache resource type for URI, evicting least recently used URIs beyond resource_type_cache_size
+
+		Args:
+			uri (rdflib.term.URIRef,str): uri of resource
+			resource_type (): resource class
+
+		Returns:
+			None
+		'''
+
+		with self._resource_type_cache_lock:
+			self._resource_type_cache[str(uri)] = resource_type
+			self._resource_type_cache.move_to_end(str(uri))
+			while len(self._resource_type_cache) > self.resource_type_cache_size:
+				self._resource_type_cache.popitem(last=False)
+
+
+	def _invalidate_uri(self, uri):
+
+		'''
+		Forget cached information about URI, e.g. after create, update, delete, move or copy.
+		Cached graphs of descendants, and of the parent whose containment triples may change, are dropped as well.
+
+		Args:
+			uri (rdflib.term.URIRef,str): uri of resource
+
+		Returns:
+			None
+		'''
+
+		with self._resource_type_cache_lock:
+			self._resource_type_cache.pop(str(uri), None)
+
+		if self.cache:
+			self.cache.invalidate(uri)
+
+
+	def _register_resource(self, resource):
+
+		'''
+		Hook fired for each resource instantiated with this repository, see Transaction
+
+		Args:
+			resource (Resource): resource
+
+		Returns:
+			None
+		'''
+
+		pass
+
+
+	def start_txn(self, txn_name=None, auto_keep_alive=False, default_auto_refresh=False):
 
 		'''
 		Request new transaction from repository, init new Transaction,
@@ -233,6 +1098,8 @@ class Repository(object):
 
 		Args:
 			txn_name (str): human name for transaction
+			auto_keep_alive (bool): if True, keep transaction alive from background thread until committed or rolled back
+			default_auto_refresh (bool): default_auto_refresh of transaction, not inherited from repository
 
 		Return:
 			(Transaction): returns intance of newly created transaction
@@ -256,7 +1123,10 @@ class Repository(object):
 				self, # pass the repository
 				txn_name,
 				txn_uri,
-				expires = txn_response.headers['Expires'])
+				expires = txn_response.headers['Expires'],
+				date = txn_response.headers.get('Date'),
+				auto_keep_alive = auto_keep_alive,
+				default_auto_refresh = default_auto_refresh)
 
 			# append to self
 			self.txns[txn_name] = txn
@@ -265,7 +1135,7 @@ class Repository(object):
 			return txn
 
 
-	def get_txn(self, txn_name, txn_uri):
+	def get_txn(self, txn_name, txn_uri, auto_keep_alive=False, default_auto_refresh=False):
 
 		'''
 		Retrieves known transaction and adds to self.txns.
@@ -276,6 +1146,8 @@ class Repository(object):
 		Args:
 			txn_prefix (str, rdflib.term.URIRef): uri of the transaction. e.g. http://localhost:8080/rest/txn:123456789
 			txn_name (str): local, human name for transaction
+			auto_keep_alive (bool): if True, keep transaction alive from background thread until committed or rolled back
+			default_auto_refresh (bool): default_auto_refresh of transaction, not inherited from repository
 
 		Return:
 			(Transaction) local instance of transactions from self.txns[txn_uri]
@@ -296,7 +1168,9 @@ class Repository(object):
 				self, # pass the repository
 				txn_name,
 				txn_uri,
-				expires = None)
+				expires = None,
+				auto_keep_alive = auto_keep_alive,
+				default_auto_refresh = default_auto_refresh)
 
 			# append to self
 			self.txns[txn_name] = txn
@@ -321,37 +1195,278 @@ class Transaction(Repository):
 	Class to represent open transactions.  Spawned by repository instance, these are stored in
 	repo.txns.
 
+	If auto_keep_alive, a background thread keeps the transaction alive, sending a keep-alive request
+	keep_alive_margin seconds before the transaction expires, until the transaction is committed or rolled back.
+	Expiration is measured from the Date header of the response, rather than the local clock, so clock skew
+	does not shorten delays.  Delays are at least keep_alive_min_delay seconds, or keep_alive_fallback_delay
+	seconds if expiration is unknown.  A transaction kept alive is not left to expire when abandoned, so it should
+	be committed or rolled back, e.g. by using it as a context manager.
+
+	As a context manager, the transaction is committed on exit, or rolled back if an exception was raised.
+
+	Transactions share the HTTP session, namespaces, caches, and custom resource type parser of the repository
+	they were spawned from, at self.repo, with only the root URI of the transaction, and default_auto_refresh, differing.
+
+	Resources instantiated with the transaction, e.g. created or retrieved, are tracked, and on commit
+	rebound to the repository, with URIs of resources and their graphs translated from transaction URIs
+	to repository URIs, such that they may be used after commit without retrieving them again.
+
 	Inherits:
 		Repository
 
 	Args:
+		repo (Repository): repository transaction was spawned from
 		txn_name (str): human name for transaction
 		txn_uri (rdflib.term.URIRef, str): URI of transaction, also to be used as Transaction root path
 		expires (str): expires information from headers
+		date (str): Date header of response with expires information, defaults to local time
+		auto_keep_alive (bool): if True, keep transaction alive from background thread
+		keep_alive_margin (int,float): seconds before expiration to send keep-alive request
+		default_auto_refresh (bool): default_auto_refresh of transaction, not inherited from repository
 	'''
 
+	# seconds between keep-alive requests, at least, and if expiration unknown
+	keep_alive_min_delay = 5
+	keep_alive_fallback_delay = 60
+
 	def __init__(self,
 			repo,
 			txn_name,
 			txn_uri,
-			expires = None
+			expires = None,
+			date = None,
+			auto_keep_alive = False,
+			keep_alive_margin = 60,
+			default_auto_refresh = False
 		):
 
-		# fire parent Repository init()
-		super().__init__(
-			txn_uri,
-			repo.username,
-			repo.password,
-			context = repo.context,
-			default_serialization = repo.default_serialization)
+		# parent repository
+		self.repo = repo
+
+		# transaction root path, ensure trailing slash
+		self.root = str(txn_uri)
+		if not self.root.endswith('/'):
+			self.root += '/'
+
+		# share configuration, session, namespaces, and caches of parent repository by reference,
+		# rather than firing parent Repository init()
+		self.username = repo.username
+		self.password = repo.password
+		self.context = repo.context
+		self.default_serialization = repo.default_serialization
+		self.default_auto_refresh = default_auto_refresh
+		self.custom_resource_type_parser = repo.custom_resource_type_parser
+		self.session = repo.session
+		self._owns_session = False
+		self.namespace_manager = repo.namespace_manager
+		self._resource_type_cache = repo._resource_type_cache
+		self._resource_type_cache_lock = repo._resource_type_cache_lock
+		self.cache = repo.cache
+		self.binary_cache = repo.binary_cache
+		self.api = API(self)
+		self.txns = {}
+		self.delete_stats = None
+
+		# resources instantiated with transaction, translated to repository URIs on commit
+		self._resources = weakref.WeakSet()
+		self._resources_lock = threading.Lock()
 
 		# Transaction init
 		self.name = txn_name
-		self.expires = expires
+		self._set_expires(expires, date)
 
 		# txn status
 		self.active = True
 
+		# keep-alive requests and closing, from any thread
+		self._txn_lock = threading.RLock()
+		self._keep_alive_stop = threading.Event()
+		self._keep_alive_thread = None
+		self.keep_alive_margin = keep_alive_margin
+		if auto_keep_alive:
+			self.start_keep_alive()
+
+
+	def __exit__(self, exc_type, exc_value, traceback):
+
+		# commit, or rollback if exception raised
+		if self.active:
+			if exc_type is None:
+				self.commit()
+			else:
+				logger.debug('exception raised in transaction %s, rolling back' % self.root)
+				self.rollback()
+		self.close()
+
+
+	def _register_resource(self, resource):
+
+		with self._resources_lock:
+			self._resources.add(resource)
+
+
+	def to_canonical_uri(self, uri):
+
+		'''
+		Translate transaction URI to repository URI, e.g. http://localhost:8080/rest/tx:123/foo to http://localhost:8080/rest/foo
+
+		Args:
+			uri (rdflib.term.URIRef,str): uri within transaction
+
+		Return:
+			(rdflib.term.URIRef,str): uri within repository, or uri unchanged if not within transaction
+		'''
+
+		uri_string = str(uri)
+		if uri_string == self.root.rstrip('/') or uri_string.startswith(self.root):
+			return type(uri)('%s%s' % (self.repo.root, uri_string[len(self.root):]))
+		return uri
+
+
+	def to_txn_uri(self, uri):
+
+		'''
+		Translate repository URI to transaction URI, e.g. http://localhost:8080/rest/foo to http://localhost:8080/rest/tx:123/foo
+
+		Args:
+			uri (rdflib.term.URIRef,str): uri within repository
+
+		Return:
+			(rdflib.term.URIRef,str): uri within transaction, or uri unchanged if not within repository
+		'''
+
+		uri_string = str(uri)
+		if uri_string.startswith(self.root) or uri_string == self.root.rstrip('/'):
+			return uri
+		if uri_string.startswith(self.repo.root):
+			return type(uri)('%s%s' % (self.root, uri_string[len(self.repo.root):]))
+		return uri
+
+
+	def _translate_resources(self):
+
+		'''
+		Rebind resources instantiated with transaction to repository, translating URIs, after commit
+
+		Args:
+			None
+
+		Return:
+			None
+		'''
+
+		with self._resources_lock:
+			resources = list(self._resources)
+			self._resources = weakref.WeakSet()
+		logger.debug('translating %s resources from transaction %s' % (len(resources), self.root))
+		for resource in resources:
+			if resource.repo is self:
+				resource._translate_uris(self.repo, self.to_canonical_uri)
+
+
+	def start_keep_alive(self):
+
+		'''
+		Start background thread keeping transaction alive, until committed, rolled back, or stopped with self.stop_keep_alive()
+
+		Args:
+			None
+
+		Return:
+			None
+		'''
+
+		with self._txn_lock:
+			if self._keep_alive_thread and self._keep_alive_thread.is_alive():
+				return
+			self._keep_alive_stop.clear()
+			self._keep_alive_thread = threading.Thread(
+				target=self._keep_alive_loop,
+				name='pyfc4-keep-alive-%s' % self.name,
+				daemon=True)
+			self._keep_alive_thread.start()
+
+
+	def stop_keep_alive(self):
+
+		'''
+		Stop background thread keeping transaction alive
+
+		Args:
+			None
+
+		Return:
+			None
+		'''
+
+		self._keep_alive_stop.set()
+		if self._keep_alive_thread and self._keep_alive_thread is not threading.current_thread():
+			self._keep_alive_thread.join()
+
+
+	def expires_in(self):
+
+		'''
+		Seconds until transaction expires, per self.expires
+
+		Args:
+			None
+
+		Return:
+			(float): seconds, or None if expiration unknown
+		'''
+
+		if self._expires_at is None:
+			return None
+		return self._expires_at - time.monotonic()
+
+
+	def _set_expires(self, expires, date=None):
+
+		'''
+		Set self.expires, and time of expiration on local monotonic clock, per Expires less Date header of response
+
+		Args:
+			expires (str): Expires header
+			date (str): Date header, defaults to local time
+
+		Return:
+			None
+		'''
+
+		self.expires = expires
+		self._expires_at = None
+		if not expires:
+			return
+		try:
+			now = email.utils.parsedate_to_datetime(date).timestamp() if date else time.time()
+			self._expires_at = time.monotonic() + email.utils.parsedate_to_datetime(expires).timestamp() - now
+		except (TypeError, ValueError):
+			logger.debug('could not parse expiration of transaction %s: %s, %s' % (self.root, expires, date))
+
+
+	def _keep_alive_loop(self):
+
+		# keep alive ahead of expiration, or after fallback delay if unknown, until stopped
+		while self.active:
+			expires_in = self.expires_in()
+			if expires_in is None:
+				delay = self.keep_alive_fallback_delay
+			else:
+				delay = max(expires_in - self.keep_alive_margin, self.keep_alive_min_delay)
+			if self._keep_alive_stop.wait(delay):
+				return
+			try:
+				with self._txn_lock:
+					if self._keep_alive_stop.is_set() or not self.active:
+						return
+					if not self.keep_alive():
+						return
+			except Exception as e:
+				logger.debug('error keeping transaction %s alive: %s' % (self.root, e))
+				if self._keep_alive_stop.wait(self.keep_alive_min_delay):
+					return
+
 
 	def keep_alive(self):
 
@@ -366,14 +1481,15 @@ class Transaction(Repository):
 		'''
 
 		# keep transaction alive
-		txn_response = self.api.http_request('POST','%sfcr:tx' % self.root, data=None, headers=None)
+		with self._txn_lock:
+			txn_response = self.api.http_request('POST','%sfcr:tx' % self.root, data=None, headers=None)
 
 		# if 204, transaction kept alive
 		if txn_response.status_code == 204:
 			logger.debug("continuing transaction: %s" % self.root)
 			# update status and timer
 			self.active = True
-			self.expires = txn_response.headers['Expires']
+			self._set_expires(txn_response.headers['Expires'], txn_response.headers.get('Date'))
 			return  True
 
 		# if 410, transaction does not exist
@@ -398,14 +1514,24 @@ class Transaction(Repository):
 			(bool)
 		'''
 
+		# stop keep-alive requests
+		self.stop_keep_alive()
+
 		# commit transaction
-		txn_response = self.api.http_request('POST','%sfcr:tx/fcr:%s' % (self.root, close_type), data=None, headers=None)
+		with self._txn_lock:
+			txn_response = self.api.http_request('POST','%sfcr:tx/fcr:%s' % (self.root, close_type), data=None, headers=None)
 
 		# if 204, transaction was closed
 		if txn_response.status_code == 204:
 			logger.debug("%s for transaction: %s, successful" % (close_type, self.root))
 			# update self.active
 			self.active = False
+			# drop responses cached for transaction URIs, shared with repository
+			if self.cache:
+				self.cache.invalidate(self.root)
+			# rebind resources to repository
+			if close_type == 'commit':
+				self._translate_resources()
 			# return
 			return True
 
@@ -451,6 +1577,679 @@ class Transaction(Repository):
 
 
 
+# Async Repository
+class AsyncRepository(object):
+
+	'''
+	Asyncio interface for a Repository, or Transaction, instance.
+
+	Methods are awaitable versions of their Repository and Resource counterparts.  Requests are
+	sent with the pooled session of the wrapped repository, from a bounded pool of worker threads,
+	such that RDF parsing, resource type detection, and SparqlUpdate queries are shared with, and
+	behave identically to, the synchronous API.
+
+	Resources returned are the usual pyfc4 resource instances, e.g. BasicContainer or NonRDFSource.
+
+	Note: to keep all concurrent requests on pooled connections, concurrency should not exceed the
+	pool_maxsize of the wrapped repository.
+
+	Args:
+		repo (Repository): instance of Repository or Transaction
+		concurrency (int): maximum number of concurrent requests
+		executor (concurrent.futures.Executor): optional, executor to run requests in, defaults to
+			a ThreadPoolExecutor with concurrency workers
+	'''
+
+	def __init__(self, repo, concurrency=10, executor=None):
+
+		self.repo = repo
+		self.concurrency = concurrency
+
+		# executor bounds number of concurrent requests
+		if executor:
+			self.executor = executor
+			self._owns_executor = False
+		else:
+			self.executor = ThreadPoolExecutor(max_workers=concurrency)
+			self._owns_executor = True
+
+
+	async def __aenter__(self):
+		return self
+
+
+	async def __aexit__(self, exc_type, exc_value, traceback):
+		await self.close()
+
+
+	async def _run(self, func, *args, **kwargs):
+
+		'''
+		Run blocking function in self.executor, and await result
+
+		Args:
+			func (callable): function to run
+			args, kwargs: passed to func
+
+		Returns:
+			result of func
+		'''
+
+		loop = asyncio.get_running_loop()
+		return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+
+	async def get_resource(self, uri, resource_type=None, response_format=None):
+
+		'''
+		Awaitable Repository.get_resource()
+
+		Args:
+			uri (rdflib.term.URIRef,str): input URI
+			resource_type (): resource class e.g. BasicContainer, NonRDFSource, or extensions thereof
+			response_format (str): expects mimetype / Content-Type header such as 'application/rdf+xml', 'text/turtle', etc.
+
+		Returns:
+			Resource
+		'''
+
+		return await self._run(self.repo.get_resource, uri, resource_type=resource_type, response_format=response_format)
+
+
+	async def create(self, resource, **kwargs):
+
+		'''
+		Awaitable Resource.create()
+
+		Args:
+			resource (Resource): resource to create
+			kwargs: passed to resource.create(), e.g. specify_uri, auto_refresh
+
+		Returns:
+			(Resource)
+		'''
+
+		return await self._run(resource.create, **kwargs)
+
+
+	async def update(self, resource, **kwargs):
+
+		'''
+		Awaitable Resource.update()
+
+		Args:
+			resource (Resource): resource to update
+			kwargs: passed to resource.update(), e.g. sparql_query_only, auto_refresh
+
+		Returns:
+			(bool)
+		'''
+
+		return await self._run(resource.update, **kwargs)
+
+
+	async def refresh(self, resource, **kwargs):
+
+		'''
+		Awaitable Resource.refresh()
+
+		Args:
+			resource (Resource): resource to refresh
+			kwargs: passed to resource.refresh()
+
+		Returns:
+			None
+		'''
+
+		return await self._run(resource.refresh, **kwargs)
+
+
+	async def delete(self, resource, **kwargs):
+
+		'''
+		Awaitable Resource.delete()
+
+		Args:
+			resource (Resource): resource to delete
+			kwargs: passed to resource.delete(), e.g. remove_tombstone
+
+		Returns:
+			(bool)
+		'''
+
+		return await self._run(resource.delete, **kwargs)
+
+
+	async def children(self, resource, as_resources=False):
+
+		'''
+		Asynchronous iterator over children of resource.  If as_resources, children are retrieved
+		concurrently, and yielded as they arrive, not necessarily in order.  At most 2 * concurrency
+		requests are queued or in flight, and requests not yet completed are cancelled if iteration
+		stops early.
+
+		Args:
+			resource (Resource): parent resource
+			as_resources (bool): if True, retrieve and yield resources instead of URIs
+
+		Yields:
+			(rdflib.term.URIRef, Resource)
+		'''
+
+		children = resource.children()
+
+		# URIs only, no requests required
+		if not as_resources:
+			for child in children:
+				yield child
+			return
+
+		# retrieve concurrently, with sliding window of queued requests, yield as completed
+		logger.debug('retrieving %s children as resources, concurrency %s' % (len(children), self.concurrency))
+		window = self.concurrency * 2
+		children = iter(children)
+		pending = set()
+		try:
+			while True:
+
+				# fill window
+				for child in children:
+					pending.add(asyncio.ensure_future(self.get_resource(child)))
+					if len(pending) >= window:
+						break
+
+				if not pending:
+					return
+
+				done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+				for task in done:
+					yield task.result()
+
+		# iteration stopped early, or failed: cancel requests not yet completed
+		finally:
+			for task in pending:
+				task.cancel()
+
+
+	async def close(self):
+
+		'''
+		Shutdown executor, if created by this instance.  The wrapped repository, and its session,
+		remain open.
+
+		Args:
+			None
+
+		Returns:
+			None
+		'''
+
+		if self._owns_executor:
+			self.executor.shutdown(wait=True)
+
+
+
+# Response Cache
+class ResponseCache(object):
+
+	'''
+	Memory bounded, least recently used, cache of parsed graphs for retrieved resources.
+
+	Entries are keyed by URI and serialization, and indexed by URI, ETag, and Content-Type for lookups of graphs
+	for responses, weighted by number of triples, and expire after ttl seconds.
+	Repository.get_resource() revalidates entries with If-None-Match / If-Modified-Since headers, and on
+	HTTP 304 instantiates the resource from a copy of the cached graph without parsing the payload again.
+
+	Args:
+		max_triples (int): maximum number of triples held across all entries
+		ttl (int): seconds after which entries are evicted
+
+	Attributes:
+		hits (int): number of requests answered with HTTP 304 and served from cache
+		misses (int): number of requests that retrieved and parsed a payload
+		evictions (int): number of entries evicted for size or age
+	'''
+
+	def __init__(self, max_triples=100000, ttl=300):
+
+		self.max_triples = max_triples
+		self.ttl = ttl
+		self.entries = OrderedDict()
+		self.triples = 0
+		self._lock = threading.RLock()
+
+		# keys of entries by URI, ETag, and Content-Type
+		self._validated = {}
+
+		# counters
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+
+	def get(self, uri, serialization):
+
+		'''
+		Return cache entry for URI and serialization, or None if absent or expired
+
+		Args:
+			uri (rdflib.term.URIRef,str): uri of resource
+			serialization (str): mimetype of requested serialization
+
+		Returns:
+			(types.SimpleNamespace): cache entry with response, graph, resource_type, and validators
+		'''
+
+		key = (str(uri), serialization)
+		with self._lock:
+			entry = self.entries.get(key)
+			if not entry:
+				return None
+			if time.time() - entry.timestamp > self.ttl:
+				logger.debug('cache entry for %s expired' % uri)
+				self._evict(key)
+				return None
+			self.entries.move_to_end(key)
+			return entry
+
+
+	def put(self, uri, serialization, response, graph, resource_type):
+
+		'''
+		Cache copy of parsed graph for response, if response carries ETag or Last-Modified validators
+
+		Args:
+			uri (rdflib.term.URIRef,str): uri of resource
+			serialization (str): mimetype of requested serialization
+			response (requests.models.Response): response from GET request
+			graph (rdflib.Graph): parsed graph of response
+			resource_type (): resource class instantiated for response
+
+		Returns:
+			None
+		'''
+
+		# build conditional headers
+		validators = {}
+		if 'ETag' in response.headers:
+			validators['If-None-Match'] = response.headers['ETag']
+		if 'Last-Modified' in response.headers:
+			validators['If-Modified-Since'] = response.headers['Last-Modified']
+		if not validators:
+			return
+
+		# skip graphs larger than cache
+		weight = len(graph)
+		if weight > self.max_triples:
+			logger.debug('graph for %s exceeds cache size, not caching' % uri)
+			return
+
+		key = (str(uri), serialization)
+		entry = SimpleNamespace(
+			uri=str(uri),
+			response=self.copy_response(response),
+			etag=response.headers.get('ETag'),
+			graph=self._copy_graph(graph),
+			weight=weight,
+			resource_type=resource_type,
+			validators=validators,
+			timestamp=time.time())
+
+		with self._lock:
+			if key in self.entries:
+				self._evict(key, count=False)
+			self.entries[key] = entry
+			self.triples += weight
+			if entry.etag:
+				self._validated[self._validated_key(entry)] = key
+
+			# evict least recently used entries beyond max_triples
+			while self.triples > self.max_triples:
+				self._evict(next(iter(self.entries)))
+
+
+	def graph(self, uri, headers):
+
+		'''
+		Return copy of cached graph for URI, if cached response has the same ETag and Content-Type as headers
+
+		Args:
+			uri (rdflib.term.URIRef,str): uri of resource
+			headers (dict): response headers of resource
+
+		Returns:
+			(rdflib.Graph): copy of cached graph, or None
+		'''
+
+		if 'ETag' not in headers:
+			return None
+		with self._lock:
+			key = self._validated.get((str(uri), headers['ETag'], headers.get('Content-Type')))
+			if key is not None:
+				return self._copy_graph(self.entries[key].graph)
+
+
+	def hit(self, uri, serialization):
+
+		'''
+		Record cache hit, resetting age of entry
+
+		Args:
+			uri (rdflib.term.URIRef,str): uri of resource
+			serialization (str): mimetype of requested serialization
+
+		Returns:
+			None
+		'''
+
+		with self._lock:
+			self.hits += 1
+			entry = self.entries.get((str(uri), serialization))
+			if entry:
+				entry.timestamp = time.time()
+
+
+	def miss(self):
+
+		'''
+		Record cache miss
+		'''
+
+		with self._lock:
+			self.misses += 1
+
+
+	def invalidate(self, uri):
+
+		'''
+		Remove entries for URI, its descendants, and its parent
+
+		Args:
+			uri (rdflib.term.URIRef,str): uri of resource
+
+		Returns:
+			None
+		'''
+
+		uri = str(uri).rstrip('/')
+		parent = uri.rsplit('/', 1)[0]
+		with self._lock:
+			for key in list(self.entries.keys()):
+				entry_uri = key[0].rstrip('/')
+				if entry_uri in [uri, parent] or entry_uri.startswith('%s/' % uri):
+					logger.debug('invalidating cache entry for %s' % key[0])
+					self._evict(key, count=False)
+
+
+	def clear(self):
+
+		'''
+		Remove all entries
+		'''
+
+		with self._lock:
+			self.entries.clear()
+			self._validated.clear()
+			self.triples = 0
+
+
+	def stats(self):
+
+		'''
+		Return cache counters
+
+		Returns:
+			(dict): hits, misses, evictions, entries, and triples
+		'''
+
+		with self._lock:
+			return {
+				'hits':self.hits,
+				'misses':self.misses,
+				'evictions':self.evictions,
+				'entries':len(self.entries),
+				'triples':self.triples
+			}
+
+
+	def copy_response(self, response):
+
+		'''
+		Shallow copy of response, with independent headers, such that resources do not share mutable headers
+		with the cache
+
+		Args:
+			response (requests.models.Response): response from GET request
+
+		Returns:
+			(requests.models.Response)
+		'''
+
+		response_copy = copy.copy(response)
+		response_copy.headers = requests.structures.CaseInsensitiveDict(response.headers)
+		response_copy.status_code = 200
+		return response_copy
+
+
+	def _evict(self, key, count=True):
+
+		'''
+		Remove entry, optionally counting as eviction
+		'''
+
+		entry = self.entries.pop(key)
+		self.triples -= entry.weight
+		if self._validated.get(self._validated_key(entry)) == key:
+			del self._validated[self._validated_key(entry)]
+		if count:
+			self.evictions += 1
+
+
+	def _validated_key(self, entry):
+
+		# URI, ETag, and Content-Type of entry
+		return (entry.uri, entry.etag, entry.response.headers.get('Content-Type'))
+
+
+	def _copy_graph(self, graph):
+
+		'''
+		Copy triples and namespace bindings of graph, without parsing
+		'''
+
+		graph_copy = rdflib.Graph()
+		for ns_prefix, ns_uri in graph.namespaces():
+			graph_copy.bind(ns_prefix, ns_uri, override=False)
+		graph_copy += graph
+		return graph_copy
+
+
+
+# Binary cache
+class BinaryCache(object):
+
+	'''
+	On-disk, size capped, content addressed cache of binary data for NonRDFSource resources.
+
+	Files are keyed by the digest of binary data in the repository, premis:hasMessageDigest, such that the same
+	binary data is cached once, regardless of URI, and a changed binary is never served from cache.  Files are
+	written to a temporary file, verified against the digest, then moved into place, such that partial files are
+	never served.  Last access is recorded as modification time, and least recently used files are evicted once
+	max_bytes is exceeded.
+
+	If revalidate, a HEAD request is sent on each access, and a cached file is only served if the ETag, or
+	Digest header, of the binary matches, guarding against descriptions of resources retrieved before the binary changed.
+
+	Args:
+		directory (str): directory of cached files, created if absent
+		max_bytes (int): maximum size of cached files, least recently used evicted first
+		revalidate (bool): if True, revalidate with HEAD request on each access
+
+	Attributes:
+		hits (int): number of accesses served from cache
+		misses (int): number of accesses that retrieved binary data
+		evictions (int): number of files evicted for size
+	'''
+
+	def __init__(self, directory, max_bytes=10737418240, revalidate=False):
+
+		self.directory = directory
+		self.max_bytes = max_bytes
+		self.revalidate = revalidate
+		self._lock = threading.RLock()
+		os.makedirs(self.directory, exist_ok=True)
+
+		# counters
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+
+	def path(self, digest):
+
+		'''
+		Return path of cached file for digest
+
+		Args:
+			digest (str): digest of binary data, e.g. 'urn:sha1:...'
+
+		Returns:
+			(str): path
+		'''
+
+		algorithm, value = str(digest).split(':')[-2:]
+		return os.path.join(self.directory, '%s-%s' % (algorithm, value))
+
+
+	def get(self, digest):
+
+		'''
+		Return path of cached file for digest, recording access, or None if not cached
+
+		Args:
+			digest (str): digest of binary data, e.g. 'urn:sha1:...'
+
+		Returns:
+			(str): path, or None
+		'''
+
+		path = self.path(digest)
+		with self._lock:
+			try:
+				os.utime(path)
+			except FileNotFoundError:
+				self.misses += 1
+				return None
+			self.hits += 1
+			return path
+
+
+	def put(self, digest, chunks):
+
+		'''
+		Write chunks of binary data to cache, verified against digest
+
+		Args:
+			digest (str): digest of binary data, e.g. 'urn:sha1:...'
+			chunks (iterable): chunks of binary data as bytes
+
+		Returns:
+			(str): path of cached file
+		'''
+
+		algorithm, value = str(digest).split(':')[-2:]
+		file_hash = hashlib.new(algorithm)
+
+		# write to temporary file, in same directory for atomic move
+		f = tempfile.NamedTemporaryFile(dir=self.directory, prefix='.tmp-', delete=False)
+		try:
+			with f:
+				for chunk in chunks:
+					file_hash.update(chunk)
+					f.write(chunk)
+			if file_hash.hexdigest() != value:
+				raise Exception('binary data does not match digest %s, not caching' % digest)
+			path = self.path(digest)
+			os.replace(f.name, path)
+		except:
+			os.remove(f.name)
+			raise
+
+		self._evict()
+		return path
+
+
+	def put_file(self, digest, source):
+
+		'''
+		Copy file to cache, verified against digest
+
+		Args:
+			digest (str): digest of binary data, e.g. 'urn:sha1:...'
+			source (str): path of file
+
+		Returns:
+			(str): path of cached file
+		'''
+
+		with open(source, 'rb') as f:
+			return self.put(digest, iter(lambda: f.read(1048576), b''))
+
+
+	def clear(self):
+
+		'''
+		Remove all cached files
+		'''
+
+		with self._lock:
+			for entry in self._entries():
+				os.remove(entry.path)
+
+
+	def stats(self):
+
+		'''
+		Return cache counters
+
+		Returns:
+			(dict): hits, misses, evictions, files, and bytes
+		'''
+
+		with self._lock:
+			entries = self._entries()
+			return {
+				'hits':self.hits,
+				'misses':self.misses,
+				'evictions':self.evictions,
+				'files':len(entries),
+				'bytes':sum([ entry.stat().st_size for entry in entries ])
+			}
+
+
+	def _entries(self):
+
+		# cached files, excluding temporary files being written
+		return [ entry for entry in os.scandir(self.directory) if entry.is_file() and not entry.name.startswith('.tmp-') ]
+
+
+	def _evict(self):
+
+		# evict least recently used files beyond max_bytes
+		with self._lock:
+			entries = sorted([ (entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in self._entries() ])
+			total = sum([ size for mtime, size, path in entries ])
+			while entries and total > self.max_bytes:
+				mtime, size, path = entries.pop(0)
+				logger.debug('evicting cached binary %s' % path)
+				try:
+					os.remove(path)
+				except FileNotFoundError:
+					pass
+				total -= size
+				self.evictions += 1
+
+
 # API
 class API(object):
 
@@ -512,12 +2311,12 @@ class API(object):
 				# if no response_format has been requested to this point, use repository instance default
 				if not response_format:
 					response_format = self.repo.default_serialization
-				# if headers present, append
-				if headers and 'Accept' not in headers.keys():
-					headers['Accept'] = response_format
 				# if headers are blank, init dictionary
-				else:
+				if not headers:
 					headers = {'Accept':response_format}
+				# if headers present, append
+				elif 'Accept' not in headers.keys():
+					headers['Accept'] = response_format
 
 		# prepare uri for HTTP request
 		if type(uri) == rdflib.term.URIRef:
@@ -526,8 +2325,8 @@ class API(object):
 		logger.debug("%s request for %s, format %s, headers %s" %
 			(verb, uri, response_format, headers))
 
-		# manually prepare request
-		session = requests.Session()
+		# manually prepare request, and send with repository session to reuse pooled connections
+		session = self.repo.session
 		request = requests.Request(verb, uri, auth=(self.repo.username, self.repo.password), data=data, headers=headers, files=files)
 		prepped_request = session.prepare_request(request)
 		response = session.send(prepped_request,
@@ -544,26 +2343,98 @@ class API(object):
 		Note: uses isinstance() as plugins may extend these base LDP resource type.
 
 		Args:
-			response (requests.models.Response): response object
+			response (requests.models.Response): response object
+
+		Returns:
+			[NonRDFSource, BasicContainer, DirectContainer, IndirectContainer]
+		'''
+
+		# no Link header, resource type not determined
+		if 'Link' not in response.headers:
+			logger.debug('no Link header, returning False')
+			return False
+		links = response.headers['Link'].split(', ')
+
+		# description of NonRDF Source, e.g. /fcr:metadata, links to binary it describes
+		if any([ 'rel="describes"' in link for link in links ]):
+			logger.debug('Link header describes binary, NonRDFSource')
+			return NonRDFSource
+
+		# parse 'Link' header
+		links = [
+			link.split(";")[0].lstrip('<').rstrip('>')
+			for link in links
+			if link.startswith('<http://www.w3.org/ns/ldp#')]
+
+		# parse resource type string with self.repo.namespace_manager.compute_qname()
+		ldp_resource_types = [
+			self.repo.namespace_manager.compute_qname(resource_type)[2]
+			for resource_type in links]
+
+		logger.debug('Parsed LDP resource types from LINK header: %s' % ldp_resource_types)
+
+		# with LDP types in hand, select appropriate resource type
+		return self._select_resource_type(ldp_resource_types)
+
+
+	def parse_resource_type_from_graph(self, uri, response):
+
+		'''
+		parse resource type from rdf:type triples of RDF payload, e.g. ldp:DirectContainer, fedora:Binary
+
+		Args:
+			uri (rdflib.term.URIRef): uri of resource
+			response (requests.models.Response): response object from GET request
+
+		Returns:
+			[NonRDFSource, BasicContainer, DirectContainer, IndirectContainer]
+		'''
+
+		graph = self.parse_rdf_payload(response.content, response.headers)
+		return self.parse_resource_type_from_triples(uri, graph)
+
+
+	def parse_resource_type_from_triples(self, uri, graph):
+
+		'''
+		parse resource type from rdf:type triples of parsed graph
+
+		Args:
+			uri (rdflib.term.URIRef): uri of resource
+			graph (rdflib.Graph): parsed graph
 
 		Returns:
 			[NonRDFSource, BasicContainer, DirectContainer, IndirectContainer]
 		'''
 
-		# parse 'Link' header
-		links = [
-			link.split(";")[0].lstrip('<').rstrip('>')
-			for link in response.headers['Link'].split(', ')
-			if link.startswith('<http://www.w3.org/ns/ldp#')]
+		rdf_types = list(graph.objects(uri, rdflib.RDF.type))
+
+		# fedora:Binary is the repository type for NonRDF Sources
+		if rdflib.term.URIRef('http://fedora.info/definitions/v4/repository#Binary') in rdf_types:
+			return NonRDFSource
 
-		# parse resource type string with self.repo.namespace_manager.compute_qname()
 		ldp_resource_types = [
-			self.repo.namespace_manager.compute_qname(resource_type)[2]
-			for resource_type in links]
+			rdf_type.toPython().split('#')[-1]
+			for rdf_type in rdf_types
+			if rdf_type.startswith('http://www.w3.org/ns/ldp#')]
 
-		logger.debug('Parsed LDP resource types from LINK header: %s' % ldp_resource_types)
+		logger.debug('Parsed LDP resource types from rdf:type triples: %s' % ldp_resource_types)
+
+		return self._select_resource_type(ldp_resource_types)
+
+
+	def _select_resource_type(self, ldp_resource_types):
+
+		'''
+		select resource type from list of LDP resource type names, e.g. ['Resource', 'BasicContainer']
+
+		Args:
+			ldp_resource_types (list): LDP resource type names
+
+		Returns:
+			[NonRDFSource, BasicContainer, DirectContainer, IndirectContainer]
+		'''
 
-		# with LDP types in hand, select appropriate resource type
 		# NonRDF Source
 		if 'NonRDFSource' in ldp_resource_types:
 			return NonRDFSource
@@ -577,7 +2448,7 @@ class API(object):
 		elif 'IndirectContainer' in ldp_resource_types:
 			return IndirectContainer
 		else:
-			logger.debug('could not determine resource type from Link header, returning False')
+			logger.debug('could not determine resource type, returning False')
 			return False
 
 
@@ -615,6 +2486,312 @@ class API(object):
 
 
 
+# JournaledStore
+class JournaledStore(rdflib.store.Store):
+
+	'''
+	rdflib store that wraps the store of a parsed graph, without copying triples, and keeps a journal of
+	triples added and removed through it.  Used by Resource for self.rdf.graph, such that self.update() can
+	build a sparql update from the journal, in time proportional to the number of changes, instead of comparing
+	the full original and modified graphs.
+
+	Only net changes are journaled: adding a triple that was removed, or removing a triple that was added, cancels out.
+	Changes involving blank nodes invalidate the journal, in which case Resource._diff_graph falls back to a full graph diff.
+
+	The original state of the graph is not copied when parsed, but derived from the journal when needed,
+	as current triples, less those added, plus those removed.  Only when the journal is invalidated is a
+	snapshot of the original triples taken, as a frozenset, before the change is applied.
+
+	Triples added or removed are also passed to the ObjectLikeTriples index, if any, at self.index.
+
+	Args:
+		store (rdflib.store.Store): store of parsed graph
+
+	Attributes:
+		journal (types.SimpleNamespace): sets of triples 'added' and 'removed', bool 'valid', and 'original' snapshot if not valid
+		index (ObjectLikeTriples): object-like triples of resource, updated as triples change
+	'''
+
+	def __init__(self, store):
+
+		super().__init__()
+		self.store = store
+		self.context_aware = store.context_aware
+		self.formula_aware = store.formula_aware
+		self.graph_aware = store.graph_aware
+		self.transaction_aware = store.transaction_aware
+		self.journal = SimpleNamespace(added=set(), removed=set(), valid=True, original=None)
+		self.index = None
+
+
+	def original_triples(self):
+
+		'''
+		Return triples of graph as originally parsed
+
+		Args:
+			None
+
+		Returns:
+			(set,frozenset): original triples
+		'''
+
+		if not self.journal.valid:
+			return self.journal.original
+		original = set( triple for triple, contexts in self.store.triples((None, None, None)) if triple not in self.journal.added )
+		original.update(self.journal.removed)
+		return original
+
+
+	def translate(self, translate, identifier):
+
+		'''
+		Return new JournaledStore with URIs of triples, journal, and snapshot, translated, e.g. from transaction to repository URIs
+
+		Args:
+			translate (callable): called with each rdflib.term.URIRef, returns translated URIRef
+			identifier (rdflib.term.Node): identifier of graph, as context of triples in new store
+
+		Returns:
+			(JournaledStore): translated store
+		'''
+
+		def translate_triple(triple):
+			return tuple( translate(term) if isinstance(term, rdflib.term.URIRef) else term for term in triple )
+
+		graph = rdflib.Graph(identifier=identifier)
+		for ns_prefix, ns_uri in self.namespaces():
+			graph.bind(ns_prefix, ns_uri, override=True)
+		for triple, contexts in self.store.triples((None, None, None)):
+			graph.add(translate_triple(triple))
+
+		store = JournaledStore(graph.store)
+		store.journal.added = set( translate_triple(triple) for triple in self.journal.added )
+		store.journal.removed = set( translate_triple(triple) for triple in self.journal.removed )
+		store.journal.valid = self.journal.valid
+		if self.journal.original is not None:
+			store.journal.original = frozenset( translate_triple(triple) for triple in self.journal.original )
+		return store
+
+
+	def clear_journal(self):
+
+		'''
+		Clear journal, such that current triples become the original triples, e.g. after changes are sent with update()
+
+		Args:
+			None
+
+		Returns:
+			None
+		'''
+
+		self.journal.added = set()
+		self.journal.removed = set()
+		self.journal.valid = True
+		self.journal.original = None
+
+
+	def _invalidate(self):
+
+		# snapshot original triples before change is applied
+		self.journal.original = frozenset(self.original_triples())
+		self.journal.valid = False
+
+
+	def _journal_add(self, triple, new):
+
+		# blank nodes cannot be reliably written from journal
+		if self._has_bnode(triple):
+			self._invalidate()
+
+		# cancels out previous removal, or records new triple
+		elif triple in self.journal.removed:
+			self.journal.removed.discard(triple)
+		elif new:
+			self.journal.added.add(triple)
+
+
+	def _journal_remove(self, triple):
+
+		# blank nodes cannot be reliably written from journal
+		if self._has_bnode(triple):
+			self._invalidate()
+
+		# cancels out previous addition, or records removal
+		elif triple in self.journal.added:
+			self.journal.added.discard(triple)
+		else:
+			self.journal.removed.add(triple)
+
+
+	def _has_bnode(self, triple):
+
+		return any(isinstance(node, rdflib.BNode) for node in triple)
+
+
+	def add(self, triple, context, quoted=False):
+
+		if not quoted and (self.journal.valid or self.index is not None):
+			new = next(self.store.triples(triple, context), None) is None
+			if self.journal.valid:
+				self._journal_add(triple, new)
+			if new and self.index is not None:
+				self.index._triple_added(triple)
+		self.store.add(triple, context, quoted)
+
+
+	def addN(self, quads):
+
+		for s,p,o,c in quads:
+			self.add((s,p,o), c)
+
+
+	def remove(self, triple, context=None):
+
+		# resolve triple patterns, e.g. from graph.set(), to triples removed
+		if self.journal.valid or self.index is not None:
+			for removed_triple, contexts in list(self.store.triples(triple, context)):
+				if self.journal.valid:
+					self._journal_remove(removed_triple)
+				if self.index is not None:
+					self.index._triple_removed(removed_triple)
+		self.store.remove(triple, context)
+
+
+	# remaining methods delegate to wrapped store
+	def triples(self, triple, context=None):
+		return self.store.triples(triple, context)
+
+	def triples_choices(self, triple, context=None):
+		return self.store.triples_choices(triple, context)
+
+	def __len__(self, context=None):
+		return self.store.__len__(context)
+
+	def contexts(self, triple=None):
+		return self.store.contexts(triple)
+
+	def add_graph(self, graph):
+		return self.store.add_graph(graph)
+
+	def remove_graph(self, graph):
+		return self.store.remove_graph(graph)
+
+	def bind(self, *args, **kwargs):
+		return self.store.bind(*args, **kwargs)
+
+	def prefix(self, namespace):
+		return self.store.prefix(namespace)
+
+	def namespace(self, prefix):
+		return self.store.namespace(prefix)
+
+	def namespaces(self):
+		return self.store.namespaces()
+
+	def query(self, *args, **kwargs):
+		return self.store.query(*args, **kwargs)
+
+	def update(self, *args, **kwargs):
+		return self.store.update(*args, **kwargs)
+
+
+
+# ObjectLikeTriples
+class ObjectLikeTriples(SimpleNamespace):
+
+	'''
+	Object-like access to triples of a resource graph, at resource.rdf.triples, as lists of objects grouped
+	by prefix and predicate, e.g. resource.rdf.triples.dc.title
+
+	When the graph is wrapped in a JournaledStore, the store passes each triple added or removed, and only
+	the affected prefix and predicate are updated.  The full index is built lazily, on first attribute access,
+	and on every access if resource.rdf.graph has been replaced with a graph that is not tracked.
+
+	Args:
+		rdf (types.SimpleNamespace): rdf of resource, with graph at rdf.graph
+	'''
+
+	__slots__ = ('_rdf', '_store', '_stale')
+
+	def __init__(self, rdf):
+
+		self._rdf = rdf
+		self._store = rdf.graph.store
+		self._stale = True
+
+
+	def __getattribute__(self, name):
+
+		# build before accessing prefixes
+		if not name.startswith('_'):
+			object.__getattribute__(self, '_build')()
+		return object.__getattribute__(self, name)
+
+
+	def __repr__(self):
+
+		self._build()
+		return super().__repr__()
+
+
+	def _tracking(self):
+
+		return self._rdf.graph.store is self._store and getattr(self._store, 'index', None) is self
+
+
+	def _build(self):
+
+		# parse all triples of graph, if not yet built or graph is not tracked
+		if self._stale or not self._tracking():
+			self.__dict__.clear()
+			for s,p,o in self._rdf.graph:
+				self._add_object(p, o)
+			self._stale = not self._tracking()
+
+
+	def _add_object(self, p, o):
+
+		# get ns info
+		ns_prefix, ns_uri, predicate = self._rdf.graph.compute_qname(p)
+
+		# if prefix as list not yet added, add
+		if ns_prefix not in self.__dict__:
+			self.__dict__[ns_prefix] = SimpleNamespace()
+
+		# append object for this prefix and predicate
+		self.__dict__[ns_prefix].__dict__.setdefault(predicate, []).append(o)
+
+
+	def _remove_object(self, p, o):
+
+		ns_prefix, ns_uri, predicate = self._rdf.graph.compute_qname(p)
+		ns = self.__dict__.get(ns_prefix)
+		if ns is None or o not in ns.__dict__.get(predicate, []):
+			return
+		ns.__dict__[predicate].remove(o)
+
+		# remove predicate, and prefix, when emptied
+		if len(ns.__dict__[predicate]) == 0:
+			del ns.__dict__[predicate]
+			if len(ns.__dict__) == 0:
+				del self.__dict__[ns_prefix]
+
+
+	def _triple_added(self, triple):
+
+		if not self._stale:
+			self._add_object(triple[1], triple[2])
+
+
+	def _triple_removed(self, triple):
+
+		if not self._stale:
+			self._remove_object(triple[1], triple[2])
+
+
+
 # SparqlUpdate
 class SparqlUpdate(object):
 
@@ -750,6 +2927,7 @@ class Resource(object):
 
 		# repository handle is pinned to resource instance here
 		self.repo = repo
+		self.repo._register_resource(self)
 
 		# parse uri with parse_uri() from repo instance
 		self.uri = self.repo.parse_uri(uri)
@@ -774,13 +2952,74 @@ class Resource(object):
 			self.status_code = None
 			self.exists = False
 
-		# RDF
-		self._build_rdf(data=self.data)
+		# RDF, parsed from self.data on first access of self.rdf
+		self._rdf = None
+
+		# children embedded in response, see Repository.get_resource(embed_children=True)
+		self._embedded_children = None
+
+		# triples omitted from partial view of resource, see Repository.get_resource(omit=[...])
+		self.omit = None
 
 		# versions
 		self.versions = SimpleNamespace()
 
 
+	@property
+	def rdf(self):
+
+		'''
+		RDF of resource, with parsed graph, prefixes, and object-like triples.
+		Built on first access, such that retrieving resources only to check existence, headers, or type, does not parse RDF.
+
+		Returns:
+			(types.SimpleNamespace)
+		'''
+
+		if self._rdf is None:
+			self._build_rdf(data=self.data)
+		return self._rdf
+
+
+	@rdf.setter
+	def rdf(self, rdf):
+
+		self._rdf = rdf
+
+
+	@property
+	def partial(self):
+
+		'''
+		True if resource was retrieved with triples omitted, see Repository.get_resource(omit=[...])
+		'''
+
+		return bool(self.omit)
+
+
+	@property
+	def dirty(self):
+
+		'''
+		True if resource has local changes to RDF, or binary data, not yet sent with update()
+		'''
+
+		# binary data set locally, sent by update()
+		if type(self) == NonRDFSource and self.binary._pending() and self.binary.data is not None:
+			return True
+
+		# RDF not yet parsed, so not modified
+		if self._rdf is None:
+			return False
+
+		# use journal if available, else diff graphs
+		journal = self.rdf._store.journal
+		if self.rdf.graph.store is self.rdf._store and journal.valid:
+			return bool(journal.added or journal.removed)
+		self._diff_graph()
+		return bool(len(self.rdf.diffs.added) or len(self.rdf.diffs.removed))
+
+
 	def __repr__(self):
 		return '<%s Resource, uri: %s>' % (self.__class__.__name__, self.uri)
 
@@ -851,7 +3090,7 @@ class Resource(object):
 			#if so, run self.binary._prep_binary()
 			if issubclass(type(self),NonRDFSource):
 				self.binary._prep_binary()
-				data = self.binary.data
+				data, headers = self.binary._prep_upload(self.headers)
 
 			# otherwise, prep for RDF
 			else:
@@ -862,10 +3101,19 @@ class Resource(object):
 				logger.debug('Serialized graph used for resource creation:')
 				logger.debug(data)
 				self.headers['Content-Type'] = serialization_format
+				headers = self.headers
 
 			# fire creation request
-			response = self.repo.api.http_request(verb, self.uri, data=data, headers=self.headers, stream=stream)
-			return self._handle_create(response, ignore_tombstone, auto_refresh)
+			response = self.repo.api.http_request(verb, self.uri, data=data, headers=headers, stream=stream)
+			if issubclass(type(self),NonRDFSource):
+				self.binary._finish_upload(response)
+			self._handle_create(response, ignore_tombstone, auto_refresh)
+
+			# if binary data streamed without known digest, verify against digest computed by repository, per RDF if refreshed
+			if issubclass(type(self),NonRDFSource):
+				refreshed = auto_refresh or (auto_refresh == None and self.repo.default_auto_refresh)
+				self.binary._verify_upload(self.uri, graph=self.rdf.graph if refreshed else None)
+			return self
 
 
 	def _handle_create(self, response, ignore_tombstone, auto_refresh):
@@ -880,9 +3128,22 @@ class Resource(object):
 
 		# 201, success, refresh
 		if response.status_code == 201:
-			# if not specifying uri, capture from response and append to object
-			self.uri = self.repo.parse_uri(response.text)
-			# creation successful
+			# if not specifying uri, capture from response and append to object, translating local RDF
+			uri = self.repo.parse_uri(response.text)
+			if uri != self.uri and self._rdf is not None:
+				previous_uri = self.uri
+				self._translate_uris(self.repo, lambda term: uri if term == previous_uri else term)
+			self.uri = uri
+			self.repo._invalidate_uri(self.uri)
+
+			# creation successful, RDF and binary data as sent are now original, such that they are not sent again
+			self.exists = True
+			if self._rdf is not None:
+				self._reset_journal()
+			if issubclass(type(self), NonRDFSource) and self.binary._pending():
+				self.binary.data = None
+				self.binary._lazy_data = True
+
 			if auto_refresh:
 				self.refresh()
 			elif auto_refresh == None:
@@ -969,12 +3230,14 @@ class Resource(object):
 		if response.status_code == 201:
 			# set self exists
 			self.exists = False
+			self.repo._invalidate_uri(self.uri)
 			# handle tombstone
 			if remove_tombstone:
 				tombstone_response = self.repo.api.http_request('DELETE', "%s/fcr:tombstone" % self.uri)
 
 			# udpdate uri, refresh, and return
 			self.uri = destination_uri
+			self.repo._invalidate_uri(self.uri)
 			self.refresh()
 			return destination_uri
 
@@ -1002,6 +3265,7 @@ class Resource(object):
 
 		# handle response
 		if response.status_code == 201:
+			self.repo._invalidate_uri(destination_uri)
 			return destination_uri
 		else:
 			raise Exception('HTTP %s, could not move resource %s to %s' % (response.status_code, self.uri, destination_uri))
@@ -1024,6 +3288,7 @@ class Resource(object):
 		# update exists
 		if response.status_code == 204:
 			# removal successful, updating self
+			self.repo._invalidate_uri(self.uri)
 			self._empty_resource_attributes()
 
 		if remove_tombstone:
@@ -1032,6 +3297,35 @@ class Resource(object):
 		return True
 
 
+	def delete_tree(self, remove_tombstone=True, include_self=True, max_workers=10):
+
+		'''
+		Method to delete resource and all resources beneath it, or, if not include_self, all resources beneath it only,
+		deleting children concurrently with repo.delete_many()
+
+		Args:
+			remove_tombstone (bool): If True, will remove tombstones when removing resources
+			include_self (bool): If True, deletes this resource, else only its children
+			max_workers (int): number of concurrent requests, should not exceed pool_maxsize of repository
+
+		Returns:
+			(list): report from repo.delete_many()
+		'''
+
+		# deleting resource deletes all beneath it
+		if include_self:
+			report = self.repo.delete_many([self.uri], remove_tombstone=remove_tombstone, max_workers=max_workers)
+			if report[0].deleted:
+				self._empty_resource_attributes()
+
+		# else, delete children
+		else:
+			report = self.repo.delete_many(self.children(), remove_tombstone=remove_tombstone, max_workers=max_workers)
+			self.repo._invalidate_uri(self.uri)
+
+		return report
+
+
 	def refresh(self, refresh_binary=True):
 
 		'''
@@ -1044,7 +3338,8 @@ class Resource(object):
 			None
 		'''
 
-		updated_self = self.repo.get_resource(self.uri)
+		# retrieve, omitting the same triples if partial
+		updated_self = self.repo.get_resource(self.uri, omit=self.omit)
 
 		# if resource type of updated_self != self, raise exception
 		if not isinstance(self, type(updated_self)):
@@ -1054,13 +3349,17 @@ class Resource(object):
 
 			# update attributes
 			self.status_code = updated_self.status_code
-			self.rdf.data = updated_self.rdf.data
+			self.response = updated_self.response
+			self.data = updated_self.data
 			self.headers = updated_self.headers
 			self.exists = updated_self.exists
+			self._embedded_children = None
 
-			# update graph if RDFSource
-			if type(self) != NonRDFSource:
-				self._parse_graph()
+			# update graph if RDFSource, and already parsed, else parsed from self.data on first access
+			if self._rdf is not None:
+				self.rdf.data = self.data
+				if type(self) != NonRDFSource:
+					self._parse_graph()
 
 			# empty versions
 			self.versions = SimpleNamespace()
@@ -1117,13 +3416,21 @@ class Resource(object):
 			None: sets self.rdf by parsing data from GET request, or setting blank graph of resource does not yet exist
 		'''
 
-		# if resource exists, parse self.rdf.data
+		# if resource exists, use graph already parsed for response, or from repository cache if response unchanged, else parse self.rdf.data
+		graph = None
 		if self.exists:
-			self.rdf.graph = self.repo.api.parse_rdf_payload(self.rdf.data, self.headers)
+			graph = getattr(self.response, 'graph', None)
+			if graph is None and self.repo.cache and 'Preference-Applied' not in self.headers:
+				graph = self.repo.cache.graph(self.uri, self.headers)
+			if graph is None and self.rdf.data is not None:
+				graph = self.repo.api.parse_rdf_payload(self.rdf.data, self.headers)
 
-		# else, create empty graph
-		else:
-			self.rdf.graph = rdflib.Graph()
+		# else, e.g. not existing, or created without retrieving RDF, create empty graph
+		if graph is None:
+			graph = rdflib.Graph()
+
+		# wrap store of graph to journal changes
+		self.rdf.graph = rdflib.Graph(store=JournaledStore(graph.store), identifier=graph.identifier)
 
 		# bind any additional namespaces from repo instance, but do not override
 		self.rdf.namespace_manager = rdflib.namespace.NamespaceManager(self.rdf.graph)
@@ -1135,8 +3442,8 @@ class Resource(object):
 			setattr(self.rdf.prefixes, ns_prefix, rdflib.Namespace(ns_uri))
 			setattr(self.rdf.uris, rdflib.Namespace(ns_uri), ns_prefix)
 
-		# pin old graph to resource, create copy graph for modifications
-		self.rdf._orig_graph = copy.deepcopy(self.rdf.graph)
+		# pin journaled store to resource, original graph is derived from this only when needed
+		self.rdf._store = self.rdf.graph.store
 
 		# parse triples for object-like access
 		self.parse_object_like_triples()
@@ -1145,64 +3452,147 @@ class Resource(object):
 	def parse_object_like_triples(self):
 
 		'''
-		method to parse triples from self.rdf.graph for object-like
-		access
+		method to parse triples from self.rdf.graph for object-like
+		access
+
+		Args:
+			None
+
+		Returns:
+			None: sets self.rdf.triples, built on first access, then updated as triples are added or removed
+		'''
+
+		# parse triples as object-like attributes in self.rdf.triples
+		self.rdf.triples = ObjectLikeTriples(self.rdf)
+
+		# register with journaled store for incremental updates
+		if isinstance(self.rdf.graph.store, JournaledStore):
+			self.rdf.graph.store.index = self.rdf.triples
+
+
+	def _diff_graph(self):
+
+		'''
+		When a resource is retrieved, the graph retrieved and parsed at that time is wrapped in a JournaledStore, self.rdf._store,
+		and all local modifications are made to self.rdf.graph, and recorded in its journal.
+		This method returns the diff between the original and modified graph in the format of three graphs:
+
+			overlap - triples SHARED by both
+			removed - triples that exist ONLY in the original graph, self._orig_graph()
+			added - triples that exist ONLY in the modified graph, self.rdf.graph
+
+		These are used for building a sparql update query for self.update.
+
+		If the journal of self.rdf.graph is valid, 'removed' and 'added' are built from the journal, and 'overlap' is left empty.
+		Otherwise, e.g. if self.rdf.graph was replaced, falls back to rdflib.compare diff of the full graphs,
+		https://github.com/RDFLib/rdflib/blob/master/rdflib/compare.py
+
+		Args:
+			None
+
+		Returns:
+			None: sets self.rdf.diffs and adds the three graphs mentioned, 'overlap', 'removed', and 'added'
+		'''
+
+		# use journal if graph is the one tracked since parsing, and journal is intact
+		journal = self.rdf._store.journal
+		if self.rdf.graph.store is self.rdf._store and journal.valid:
+			overlap, removed, added = rdflib.Graph(), rdflib.Graph(), rdflib.Graph()
+			for triple in journal.removed:
+				removed.add(triple)
+			for triple in journal.added:
+				added.add(triple)
+
+		# else, run full diff
+		else:
+			logger.debug('journal for %s not available, running full graph diff' % self.uri)
+			overlap, removed, added = graph_diff(
+				to_isomorphic(self._orig_graph()),
+				to_isomorphic(self.rdf.graph))
+		diffs = SimpleNamespace()
+		diffs.overlap = overlap
+		diffs.removed = removed
+		diffs.added = added
+		self.rdf.diffs = diffs
+
+
+	def _reset_journal(self):
+
+		'''
+		Make self.rdf.graph the original graph, clearing its journal, or journaling it if replaced since parsing
+
+		Args:
+			None
+
+		Returns:
+			None
+		'''
+
+		if self.rdf.graph.store is self.rdf._store:
+			self.rdf._store.clear_journal()
+
+		# graph replaced since parsing, wrap its store to journal changes
+		else:
+			self.rdf.graph = rdflib.Graph(store=JournaledStore(self.rdf.graph.store), identifier=self.rdf.graph.identifier)
+			self.rdf.namespace_manager = rdflib.namespace.NamespaceManager(self.rdf.graph)
+			self.rdf._store = self.rdf.graph.store
+			self.parse_object_like_triples()
+
+
+	def _orig_graph(self):
+
+		'''
+		Builds graph as retrieved and parsed, from the journaled store pinned at self.rdf._store
 
 		Args:
 			None
 
 		Returns:
-			None: sets self.rdf.triples
+			(rdflib.Graph): original graph
 		'''
 
-		# parse triples as object-like attributes in self.rdf.triples
-		self.rdf.triples = SimpleNamespace() # prepare triples
-		for s,p,o in self.rdf.graph:
-
-			# get ns info
-			ns_prefix, ns_uri, predicate = self.rdf.graph.compute_qname(p)
+		orig_graph = rdflib.Graph()
+		for triple in self.rdf._store.original_triples():
+			orig_graph.add(triple)
+		return orig_graph
 
-			# if prefix as list not yet added, add
-			if not hasattr(self.rdf.triples, ns_prefix):
-				setattr(self.rdf.triples, ns_prefix, SimpleNamespace())
 
-			# same for predicate
-			if not hasattr(getattr(self.rdf.triples, ns_prefix), predicate):
-				setattr(getattr(self.rdf.triples, ns_prefix), predicate, [])
-
-			# append object for this prefix
-			getattr(getattr(self.rdf.triples, ns_prefix), predicate).append(o)
-
-
-	def _diff_graph(self):
+	def _translate_uris(self, repo, translate):
 
 		'''
-		Uses rdflib.compare diff, https://github.com/RDFLib/rdflib/blob/master/rdflib/compare.py
-		When a resource is retrieved, the graph retrieved and parsed at that time is saved to self.rdf._orig_graph,
-		and all local modifications are made to self.rdf.graph.  This method compares the two graphs and returns the diff
-		in the format of three graphs:
-
-			overlap - triples SHARED by both
-			removed - triples that exist ONLY in the original graph, self.rdf._orig_graph
-			added - triples that exist ONLY in the modified graph, self.rdf.graph
-
-		These are used for building a sparql update query for self.update.
+		Rebind resource to repo, translating URIs of resource and its graph, e.g. from transaction URIs to repository URIs after commit,
+		without retrieving resource again.  Local changes not yet sent with update() are kept, and translated as well.
 
 		Args:
-			None
+			repo (Repository): repository to rebind to
+			translate (callable): called with each rdflib.term.URIRef, returns translated URIRef
 
 		Returns:
-			None: sets self.rdf.diffs and adds the three graphs mentioned, 'overlap', 'removed', and 'added'
+			None
 		'''
 
-		overlap, removed, added = graph_diff(
-			to_isomorphic(self.rdf._orig_graph),
-			to_isomorphic(self.rdf.graph))
-		diffs = SimpleNamespace()
-		diffs.overlap = overlap
-		diffs.removed = removed
-		diffs.added = added
-		self.rdf.diffs = diffs
+		# parse RDF, if not yet parsed, from payload retrieved at previous URI
+		if self.exists and self.data is not None:
+			self.rdf
+
+		self.uri = translate(self.uri)
+		self.repo = repo
+		self.repo._register_resource(self)
+
+		# translate graph, and original graph derived from journaled store
+		if self._rdf is not None:
+			identifier = self.rdf.graph.identifier
+			store = self.rdf._store.translate(translate, identifier)
+			if self.rdf.graph.store is self.rdf._store:
+				graph = rdflib.Graph(store=store, identifier=identifier)
+
+			# graph replaced since parsing, translate as untracked graph
+			else:
+				graph = rdflib.Graph(store=JournaledStore(self.rdf.graph.store).translate(translate, identifier).store, identifier=identifier)
+			self.rdf._store = store
+			self.rdf.graph = graph
+			self.rdf.namespace_manager = rdflib.namespace.NamespaceManager(self.rdf.graph)
+			self.parse_object_like_triples()
 
 
 	def add_namespace(self, ns_prefix, ns_uri):
@@ -1246,7 +3636,7 @@ class Resource(object):
 		self.exists = False
 
 		# build RDF
-		self.rdf = self._build_rdf()
+		self._build_rdf()
 
 		# if NonRDF, empty binary data
 		if type(self) == NonRDFSource:
@@ -1294,7 +3684,7 @@ class Resource(object):
 		Args:
 			p (rdflib.term.URIRef): predicate
 			o (): object
-			auto_refresh (bool): whether or not to update object-like self.rdf.triples
+			auto_refresh (bool): retained for compatibility, self.rdf.triples is updated as triples change
 
 		Returns:
 			None: adds triple to self.rdf.graph
@@ -1302,9 +3692,6 @@ class Resource(object):
 
 		self.rdf.graph.add((self.uri, p, self._handle_object(o)))
 
-		# determine if triples refreshed
-		self._handle_triple_refresh(auto_refresh)
-
 
 	def set_triple(self, p, o, auto_refresh=True):
 
@@ -1314,7 +3701,7 @@ class Resource(object):
 		Args:
 			p (rdflib.term.URIRef): predicate
 			o (): object
-			auto_refresh (bool): whether or not to update object-like self.rdf.triples
+			auto_refresh (bool): retained for compatibility, self.rdf.triples is updated as triples change
 
 		Returns:
 			None: modifies pre-existing triple in self.rdf.graph
@@ -1322,9 +3709,6 @@ class Resource(object):
 
 		self.rdf.graph.set((self.uri, p, self._handle_object(o)))
 
-		# determine if triples refreshed
-		self._handle_triple_refresh(auto_refresh)
-
 
 	def remove_triple(self, p, o, auto_refresh=True):
 
@@ -1334,7 +3718,7 @@ class Resource(object):
 		Args:
 			p (rdflib.term.URIRef): predicate
 			o (): object
-			auto_refresh (bool): whether or not to update object-like self.rdf.triples
+			auto_refresh (bool): retained for compatibility, self.rdf.triples is updated as triples change
 
 		Returns:
 			None: removes triple from self.rdf.graph
@@ -1342,31 +3726,13 @@ class Resource(object):
 
 		self.rdf.graph.remove((self.uri, p, self._handle_object(o)))
 
-		# determine if triples refreshed
-		self._handle_triple_refresh(auto_refresh)
-
-
-	def _handle_triple_refresh(self, auto_refresh):
-
-		'''
-		method to refresh self.rdf.triples if auto_refresh or defaults set to True
-		'''
-
-		# if auto_refresh set, and True, refresh
-		if auto_refresh:
-			self.parse_object_like_triples()
-
-		# else, if auto_refresh is not set (None), check repository instance default
-		elif auto_refresh == None:
-			if self.repo.default_auto_refresh:
-				self.parse_object_like_triples()
-
 
 	def update(self, sparql_query_only=False, auto_refresh=None, update_binary=True):
 
 		'''
 		Method to update resources in repository.  Firing this method computes the difference in the local modified graph and the original one,
 		creates an instance of SparqlUpdate and builds a sparql query that represents these differences, and sends this as a PATCH request.
+		If there are no differences, the PATCH request is skipped.
 
 		Note: send PATCH request, regardless of RDF or NonRDF, to [uri]/fcr:metadata
 
@@ -1386,32 +3752,58 @@ class Resource(object):
 		sq = SparqlUpdate(self.rdf.prefixes, self.rdf.diffs)
 		if sparql_query_only:
 			return sq.build_query()
-		response = self.repo.api.http_request(
-			'PATCH',
-			'%s/fcr:metadata' % self.uri, # send RDF updates to URI/fcr:metadata
-			data=sq.build_query(),
-			headers={'Content-Type':'application/sparql-update'})
-
-		# if RDF update not 204, raise Exception
-		if response.status_code != 204:
-			logger.debug(response.content)
-			raise Exception('HTTP %s, expecting 204' % response.status_code)
-
-		# if NonRDFSource, and self.binary.data is not a Response object, update binary as well
-		if type(self) == NonRDFSource and update_binary and type(self.binary.data) != requests.models.Response:
+
+		# if no net changes to RDF, skip PATCH
+		if len(self.rdf.diffs.added) == 0 and len(self.rdf.diffs.removed) == 0:
+			logger.debug('no changes to RDF for %s, skipping PATCH' % self.uri)
+
+		else:
+			response = self.repo.api.http_request(
+				'PATCH',
+				'%s/fcr:metadata' % self.uri, # send RDF updates to URI/fcr:metadata
+				data=sq.build_query(),
+				headers={'Content-Type':'application/sparql-update'})
+
+			# if RDF update not 204, raise Exception
+			if response.status_code != 204:
+				logger.debug(response.content)
+				raise Exception('HTTP %s, expecting 204' % response.status_code)
+			self.repo._invalidate_uri(self.uri)
+
+			# RDF as sent is now original RDF, such that changes are not sent again
+			self._reset_journal()
+
+		# if NonRDFSource, and self.binary.data set, rather than retrieved, update binary as well
+		binary_uploaded = False
+		if type(self) == NonRDFSource and update_binary and self.binary._pending() and self.binary._unchanged():
+			logger.debug('binary data for %s unchanged, skipping PUT' % self.uri)
+			self.binary.data = None
+			self.binary._lazy_data = True
+
+		elif type(self) == NonRDFSource and update_binary and self.binary._pending():
 			self.binary._prep_binary()
-			binary_data = self.binary.data
+			binary_data, headers = self.binary._prep_upload({'Content-Type':self.binary.mimetype})
 			binary_response = self.repo.api.http_request(
 				'PUT',
 				self.uri,
 				data=binary_data,
-				headers={'Content-Type':self.binary.mimetype})
+				headers=headers)
+			self.binary._finish_upload(binary_response)
+			self.repo._invalidate_uri(self.uri)
+
+			# if binary update not 201 or 204, e.g. 409 for digest mismatch, raise Exception
+			if binary_response.status_code not in [201, 204]:
+				logger.debug(binary_response.content)
+				raise Exception('HTTP %s, could not update binary data' % binary_response.status_code)
+			verify_graph = None
 
 			# if not refreshing RDF, still update binary here
 			if not auto_refresh and not self.repo.default_auto_refresh:
 				logger.debug("not refreshing resource RDF, but updated binary, so must refresh binary data")
 				updated_self = self.repo.get_resource(self.uri)
 				self.binary.refresh(updated_self)
+				verify_graph = updated_self.rdf.graph
+			binary_uploaded = True
 
 		# fire optional post-update hook
 		if hasattr(self,'_post_update'):
@@ -1421,11 +3813,18 @@ class Resource(object):
 		'''
 		If not updating binary, pass that bool to refresh as refresh_binary flag to avoid touching binary data
 		'''
+		refreshed = False
 		if auto_refresh:
 			self.refresh(refresh_binary=update_binary)
+			refreshed = True
 		elif auto_refresh == None:
 			if self.repo.default_auto_refresh:
 				self.refresh(refresh_binary=update_binary)
+				refreshed = True
+
+		# if binary data streamed without known digest, verify against digest computed by repository, per RDF if retrieved
+		if binary_uploaded:
+			self.binary._verify_upload(self.uri, graph=self.rdf.graph if refreshed else verify_graph)
 		return True
 
 
@@ -1441,16 +3840,78 @@ class Resource(object):
 			(list): list of resources
 		'''
 
+		# containment triples omitted from partial view
+		if self.omit and 'containment' in self.omit:
+			raise Exception('containment triples omitted from resource %s, retrieve without omitting containment for children' % self.uri)
+
 		children = [o for s,p,o in self.rdf.graph.triples((None, self.rdf.prefixes.ldp.contains, None))]
 
-		# if as_resources, issue GET requests for children and return
+		# if as_resources, use children embedded in response, and issue concurrent GET requests for others
 		if as_resources:
 			logger.debug('retrieving children as resources')
-			children = [ self.repo.get_resource(child) for child in children ]
+			embedded = { child.uri:child for child in self._embedded_children or [] if child }
+			retrieved = self.repo._retrieve_resources([ child for child in children if child not in embedded ])
+			retrieved = { child.uri:child for child in retrieved if child }
+			children = [ embedded.get(child, retrieved.get(child, False)) for child in children ]
 
 		return children
 
 
+	def iter_children(self, as_resources=False, prefetch=10, batch_size=None):
+
+		'''
+		method to iterate through hierarchical children of this resource, without building a list of all children,
+		for very large containers
+
+		When as_resources, children are retrieved concurrently ahead of those yielded, with at most 2 * prefetch
+		requests queued at a time, such that the network stays busy while memory stays bounded.
+
+		Args:
+			as_resources (bool): if True, opens each as appropriate resource type instead of return URI only
+			prefetch (int): number of children retrieved concurrently when as_resources
+			batch_size (int): if provided, yield lists of up to batch_size children, instead of each child
+
+		Yields:
+			child URI or resource, or list of these if batch_size
+		'''
+
+		# containment triples omitted from partial view
+		if self.omit and 'containment' in self.omit:
+			raise Exception('containment triples omitted from resource %s, retrieve without omitting containment for children' % self.uri)
+
+		children = ( o for s,p,o in self.rdf.graph.triples((None, self.rdf.prefixes.ldp.contains, None)) )
+
+		# if as_resources, use children embedded in response, else retrieve concurrently
+		if as_resources:
+			if self._embedded_children is not None:
+				embedded = { child.uri:child for child in self._embedded_children if child }
+				children = ( embedded[child] if child in embedded else self.repo.get_resource(child) for child in children )
+			else:
+				children = self._iter_retrieved(children, prefetch)
+
+		# yield children, or batches of children
+		if not batch_size:
+			yield from children
+		else:
+			batch = []
+			for child in children:
+				batch.append(child)
+				if len(batch) == batch_size:
+					yield batch
+					batch = []
+			if batch:
+				yield batch
+
+
+	def _iter_retrieved(self, uris, max_workers):
+
+		# retrieve resources in order, raising errors
+		for uri, resource in self.repo.get_resources(uris, max_workers=max_workers):
+			if isinstance(resource, Exception):
+				raise resource
+			yield resource
+
+
 	def parents(self, as_resources=False):
 
 		'''
@@ -1465,10 +3926,10 @@ class Resource(object):
 
 		parents = [o for s,p,o in self.rdf.graph.triples((None, self.rdf.prefixes.fedora.hasParent, None))]
 
-		# if as_resources, issue GET requests for children and return
+		# if as_resources, issue GET requests for parents and return
 		if as_resources:
 			logger.debug('retrieving parent as resource')
-			parents = [ self.repo.get_resource(parent) for parent in parents ]
+			parents = self.repo._retrieve_resources(parents)
 
 		return parents
 
@@ -1663,23 +4124,99 @@ class BinaryData(object):
 	Class to handle binary data for NonRDFSource (Binary) resources
 	Builds out self.binary, and provides some method for setting/accessing binary data
 
+	If the resource exists, binary data is not retrieved until self.data, self.open(), or self.iter_content() is first accessed,
+	and mimetype is not parsed until self.mimetype is first accessed.
+
+	When uploading, file-like objects and iterators are streamed in chunks of upload_chunk_size, while SHA-1, SHA-256,
+	and MD5 digests are computed in the same pass.  If self.digest is set, e.g. 'sha1=...', or binary data is bytes
+	and digest is computed before sending, it is sent as the Digest header for the repository to verify.  Otherwise,
+	the SHA-1 digest is verified against the digest computed by the repository after upload, at the cost of a GET request
+	for the description of the binary, unless verify_upload is False.  Statistics of the last upload are available at self.upload_stats.
+
 	Args:
 		resource (NonRDFSource): instance of NonRDFSource resource
 	'''
 
+	# bytes read from file-like objects, and sent, at a time
+	upload_chunk_size = 1048576
+
+	# digests computed while uploading
+	upload_digest_algorithms = ['sha1', 'sha256', 'md5']
+
+	# verify streamed uploads, sent without Digest header, against digest computed by repository
+	verify_upload = True
+
 	def __init__(self, resource, binary_data, binary_mimetype):
 
 		# scaffold
 		self.resource = resource
 		self.delivery = None
-		self.data = binary_data
 		self.stream = False
-		self.mimetype = binary_mimetype
 		self.location = None
 
-		# if resource exists, issue GET and prep for use
-		if self.resource.exists:
-			self.parse_binary()
+		# known digest of binary data for upload, e.g. 'sha1=...', and statistics of last upload
+		self.digest = None
+		self.upload_stats = None
+		self._upload = None
+
+		# digest of seekable file-like object, computed when comparing with repository, sent when uploading
+		self._computed_digest = None
+
+		# size, digest, and mimetype of binary data in repository, if uploaded or refreshed since RDF of resource was parsed
+		self._stored = None
+
+		# if resource exists, retrieve binary data and parse mimetype on first access
+		self._data = binary_data
+		self._mimetype = binary_mimetype
+		self._lazy_data = self._lazy_mimetype = bool(self.resource.exists)
+
+
+	@property
+	def data(self):
+
+		'''
+		Binary data, as set for create or update, or if resource exists, a streamable requests.models.Response retrieved on first access
+		'''
+
+		if self._lazy_data:
+			self._lazy_data = False
+			self._data = self._get_binary()
+		return self._data
+
+
+	@data.setter
+	def data(self, data):
+
+		self._lazy_data = False
+		self._data = data
+
+
+	@property
+	def mimetype(self):
+
+		'''
+		Mimetype of binary data, as set for create or update, or if resource exists, parsed from RDF of resource on first access
+		'''
+
+		if self._lazy_mimetype:
+			self._lazy_mimetype = False
+			self._mimetype = self.resource.rdf.graph.value(
+				self.resource.uri,
+				self.resource.rdf.prefixes.ebucore.hasMimeType)
+			if self._mimetype is not None:
+				self._mimetype = self._mimetype.toPython()
+
+			# if mimetype omitted from description, e.g. server managed triples omitted, use Content-Type of binary
+			else:
+				self._mimetype = self.data.headers.get('Content-Type')
+		return self._mimetype
+
+
+	@mimetype.setter
+	def mimetype(self, mimetype):
+
+		self._lazy_mimetype = False
+		self._mimetype = mimetype
 
 
 	def empty(self):
@@ -1710,24 +4247,58 @@ class BinaryData(object):
 		'''
 
 		logger.debug('refreshing binary attributes')
+		self.close()
 		self.mimetype = updated_self.binary.mimetype
-		self.data = updated_self.binary.data
+		self._stored = updated_self.binary._repository_description()
+
+		# binary data retrieved on first access, if not yet retrieved
+		self._data = updated_self.binary._data
+		self._lazy_data = updated_self.binary._lazy_data
 
 
 	def parse_binary(self):
 
 		'''
 		when retrieving a NonRDF resource, parse binary data and make available
-		via generators
+		via generators, now rather than on first access
 		'''
 
+		# get binary content as streamable response
+		self.close()
+		self.data = self._get_binary()
+
 		# derive mimetype
-		self.mimetype = self.resource.rdf.graph.value(
-			self.resource.uri,
-			self.resource.rdf.prefixes.ebucore.hasMimeType).toPython()
+		self._lazy_mimetype = True
+		self.mimetype
+
+
+	def _get_binary(self):
+
+		# if binary cache, serve from local disk, caching on miss
+		binary_cache = getattr(self.resource.repo, 'binary_cache', None)
+		if binary_cache is not None:
+			stored = self._repository_description()
+			if stored.digest:
+				path = self._cached(binary_cache, stored.digest)
+				if path is None and (stored.size is None or stored.size <= binary_cache.max_bytes):
+					response = self._request_binary()
+					try:
+						path = binary_cache.put(stored.digest, response.iter_content(self.upload_chunk_size))
+					except Exception as e:
+						logger.debug('could not cache binary data for %s: %s' % (self.resource.uri, e))
+					finally:
+						response.close()
+				if path is not None:
+					return self._cached_response(path, stored)
+
+		return self._request_binary()
+
+
+	def _request_binary(self):
 
-		# get binary content as stremable response
-		self.data = self.resource.repo.api.http_request(
+		# get binary content as streamable response
+		logger.debug('retrieving binary data for %s' % self.resource.uri)
+		return self.resource.repo.api.http_request(
 			'GET',
 			self.resource.uri,
 			data=None,
@@ -1736,6 +4307,117 @@ class BinaryData(object):
 			stream=True)
 
 
+	def _cached(self, binary_cache, digest):
+
+		'''
+		Path of binary data in binary cache, if cached and, if binary cache revalidates, unchanged in repository
+
+		Args:
+			binary_cache (BinaryCache): binary cache of repository
+			digest (str): digest of binary data, e.g. 'urn:sha1:...'
+
+		Returns:
+			(str): path, or None
+		'''
+
+		path = binary_cache.get(digest)
+		if path is None or not binary_cache.revalidate:
+			return path
+
+		# binary ETag, else Digest header, is digest of binary data in repository
+		response = self.resource.repo.api.http_request('HEAD', self.resource.uri, is_rdf=False)
+		value = digest.split(':')[-1]
+		etag = response.headers.get('ETag', '').replace('W/', '').strip('"')
+		if etag == value or value in response.headers.get('Digest', ''):
+			return path
+		logger.debug('binary data for %s changed since described, not serving from binary cache' % self.resource.uri)
+		return None
+
+
+	def _cached_response(self, path, stored):
+
+		# response for binary data from binary cache, read from file as from repository
+		logger.debug('serving binary data for %s from binary cache' % self.resource.uri)
+		response = requests.models.Response()
+		response.status_code = 200
+		response.url = str(self.resource.uri)
+		response.headers['Content-Length'] = str(os.path.getsize(path))
+		if stored.mimetype:
+			response.headers['Content-Type'] = stored.mimetype
+		response.raw = open(path, 'rb')
+		return response
+
+
+	def _pending(self):
+
+		# binary data set locally, not retrieved
+		return not self._lazy_data and type(self._data) != requests.models.Response
+
+
+	def open(self):
+
+		'''
+		Open binary data as readable, file-like object, streamed from repository, or read from binary cache.
+		Close when done, e.g. by using as context manager, to release connection.
+
+		Args:
+			None
+
+		Returns:
+			(urllib3.response.HTTPResponse, io.BufferedReader): file-like object
+		'''
+
+		# hand off streamed response, binary data retrieved again on next access
+		response = self.data
+		if type(response) != requests.models.Response:
+			raise Exception('binary data for %s was not retrieved from repository' % self.resource.uri)
+		self._data = None
+		self._lazy_data = True
+		if hasattr(response.raw, 'decode_content'):
+			response.raw.decode_content = True
+		return response.raw
+
+
+	def iter_content(self, chunk_size=1048576):
+
+		'''
+		Iterate through binary data, streamed from repository, in chunks.
+		Connection is released when exhausted, or generator is closed.
+
+		Args:
+			chunk_size (int): bytes per chunk
+
+		Yields:
+			(bytes): chunk of binary data
+		'''
+
+		response = self.data
+		if type(response) != requests.models.Response:
+			raise Exception('binary data for %s was not retrieved from repository' % self.resource.uri)
+		try:
+			yield from response.iter_content(chunk_size)
+		finally:
+			self.close()
+
+
+	def close(self):
+
+		'''
+		Release connection of binary data streamed from repository, which is retrieved again on next access
+
+		Args:
+			None
+
+		Returns:
+			None
+		'''
+
+		if type(self._data) == requests.models.Response:
+			self._data.close()
+			self._data = None
+			self._lazy_data = True
+
+
 	def _prep_binary(self):
 
 		'''
@@ -1825,6 +4507,139 @@ class BinaryData(object):
 					self.delivery = 'payload'
 
 
+	def _prep_upload(self, headers):
+
+		'''
+		Prepare binary data for upload, as bytes, or as generator streaming chunks of file-like object or iterator,
+		computing digests as binary data is read
+
+		Args:
+			headers (dict): headers for request
+
+		Returns:
+			(tuple): data and headers for request
+		'''
+
+		hashes = { algorithm:hashlib.new(algorithm) for algorithm in self.upload_digest_algorithms }
+		self._upload = SimpleNamespace(hashes=hashes, bytes=0, stime=None, digest_sent=False, mimetype=headers.get('Content-Type'), data=self.data is not None, stored=None)
+		headers = dict(headers)
+
+		def read(chunk):
+			if isinstance(chunk, str):
+				chunk = chunk.encode('utf-8')
+			for file_hash in hashes.values():
+				file_hash.update(chunk)
+			self._upload.bytes += len(chunk)
+			return chunk
+
+		def stream(data):
+			if hasattr(data, 'read'):
+				for chunk in iter(lambda: data.read(self.upload_chunk_size), data.read(0)):
+					yield read(chunk)
+			else:
+				for chunk in data:
+					yield read(chunk)
+
+		# bytes, digest computed before sending
+		data = self.data
+		if isinstance(data, (str, bytes, bytearray)):
+			data = read(data)
+			if not self.digest:
+				headers['Digest'] = 'sha1=%s' % hashes['sha1'].hexdigest()
+				self._upload.digest_sent = True
+
+		# file-like object or iterator, streamed
+		elif data is not None:
+			data = stream(data)
+
+		# known digest
+		if self.digest:
+			headers['Digest'] = self.digest
+			self._upload.digest_sent = True
+
+		# digest computed for seekable file-like object when comparing with repository, sent for repository to verify
+		elif self._computed_digest and self._computed_digest.data is self.data:
+			headers['Digest'] = 'sha1=%s' % self._computed_digest.digest
+			self._upload.digest_sent = True
+		self._computed_digest = None
+
+		self._upload.stime = time.time()
+		return data, headers
+
+
+	def _finish_upload(self, response):
+
+		'''
+		Record statistics of upload at self.upload_stats
+
+		Args:
+			response (requests.models.Response): response of upload request
+
+		Returns:
+			None
+		'''
+
+		elapsed = time.time() - self._upload.stime
+		self.upload_stats = SimpleNamespace(
+			bytes=self._upload.bytes,
+			elapsed=elapsed,
+			rate=self._upload.bytes / elapsed if elapsed else None,
+			digests={ algorithm:file_hash.hexdigest() for algorithm, file_hash in self._upload.hashes.items() },
+			digest_sent=self._upload.digest_sent,
+			verified=True if self._upload.digest_sent and response.status_code in [201, 204] else None)
+		logger.debug('uploaded %s bytes in %.3f seconds' % (self.upload_stats.bytes, elapsed))
+
+		# binary data in repository, as uploaded, with digest only once verified
+		if response.status_code in [201, 204]:
+			sha1 = self.upload_stats.digests.get('sha1') if self._upload.data else None
+			self._upload.stored = SimpleNamespace(
+				size=self.upload_stats.bytes if self._upload.data else None,
+				digest='urn:sha1:%s' % sha1 if sha1 else None,
+				mimetype=self._upload.mimetype)
+			self._stored = self._upload.stored if self.upload_stats.verified else SimpleNamespace(
+				size=self._upload.stored.size,
+				digest=None,
+				mimetype=self._upload.stored.mimetype)
+
+
+	def _verify_upload(self, uri, graph=None):
+
+		'''
+		If binary data was streamed without Digest header, verify digest computed while uploading against
+		premis:hasMessageDigest computed by repository, unless self.verify_upload is False
+
+		Until verified, the digest of binary data in the repository is not known, such that a later update()
+		with the same binary data is not skipped as unchanged.
+
+		Args:
+			uri (rdflib.term.URIRef): uri of resource
+			graph (rdflib.Graph): optional, RDF of resource retrieved after upload, e.g. by refresh, else description of binary is retrieved
+
+		Returns:
+			None
+		'''
+
+		if not self.upload_stats or self.upload_stats.digest_sent or not self.upload_stats.bytes or not self.verify_upload:
+			return
+
+		# digest per RDF retrieved after upload, else retrieve description of binary
+		digest_predicate = rdflib.term.URIRef('%shasMessageDigest' % self.resource.repo.context['premis'])
+		stored = graph.value(rdflib.term.URIRef(uri), digest_predicate) if graph is not None else None
+		if stored is None:
+			response = self.resource.repo.api.http_request('GET', '%s/fcr:metadata' % uri)
+			graph = self.resource.repo.api.parse_rdf_payload(response.content, response.headers)
+			stored = graph.value(rdflib.term.URIRef(uri), digest_predicate)
+		if stored is None:
+			logger.debug('no digest found for %s, could not verify upload' % uri)
+			return
+
+		algorithm, expected = str(stored).split(':')[-2:]
+		if self.upload_stats.digests.get(algorithm) != expected:
+			raise Exception('digest of binary data uploaded to %s, %s, does not match repository digest %s, binary data as stored remains in repository, update again to replace' % (uri, self.upload_stats.digests.get(algorithm), stored))
+		self.upload_stats.verified = True
+		self._stored = self._upload.stored
+
+
 	def range(self, byte_start, byte_end, stream=True):
 
 		'''
@@ -1859,6 +4674,271 @@ class BinaryData(object):
 
 
 
+	def download(self, path, parts=4, chunk_size=1048576, verify=True, checkpoint_size=8388608):
+
+		'''
+		method to download binary data to file, retrieving byte ranges concurrently with self.range()
+
+		Binary data is split by size into parts, retrieved concurrently, and written directly into the preallocated file.
+		Progress is recorded in a sidecar file, path + '.download', every checkpoint_size bytes of each part, and when each part
+		completes, such that an interrupted download resumes where it left off when called again.  When complete, the file is
+		verified against the digest of the binary in the repository, and if it does not match, renamed to path + '.corrupt'.
+		If the repository has a binary cache, cached binary data is copied from local disk, and downloaded binary data is cached.
+
+		Args:
+			path (str): path of output file
+			parts (int): number of byte ranges retrieved concurrently, should not exceed pool_maxsize of repository
+			chunk_size (int): bytes read from each response, and written, at a time
+			verify (bool): if True, verify file against premis:hasMessageDigest of binary
+			checkpoint_size (int): bytes of each part downloaded between recording progress
+
+		Returns:
+			(types.SimpleNamespace): path, size, resumed as bytes already downloaded, verified, and elapsed seconds
+		'''
+
+		stime = time.time()
+		sidecar = '%s.download' % path
+
+		# size and digest from RDF of resource, else from HEAD request
+		size = self._repository_size()
+		digest = self._repository_digest()
+		if size is None:
+			head_response = self.resource.repo.api.http_request('HEAD', self.resource.uri, is_rdf=False)
+			size = int(head_response.headers['Content-Length'])
+
+		# copy from binary cache, verified when cached
+		binary_cache = getattr(self.resource.repo, 'binary_cache', None)
+		if binary_cache is not None and digest:
+			cached = self._cached(binary_cache, digest)
+			if cached is not None:
+				logger.debug('copying binary data for %s from binary cache to %s' % (self.resource.uri, path))
+				shutil.copyfile(cached, path)
+				if os.path.exists(sidecar):
+					os.remove(sidecar)
+				return SimpleNamespace(path=path, size=size, resumed=0, verified=True, elapsed=time.time() - stime)
+
+		# resume from sidecar, if for same binary data
+		state = None
+		if os.path.exists(sidecar) and os.path.exists(path) and os.path.getsize(path) == size:
+			with open(sidecar) as f:
+				state = json.load(f)
+			if state.get('uri') != str(self.resource.uri) or state.get('size') != size or state.get('digest') != digest:
+				logger.debug('binary data changed since download of %s started, restarting' % path)
+				state = None
+
+		# else, split into ranges, and preallocate file
+		if not state:
+			part_size = max(-(-size // parts), 1)
+			state = {
+				'uri':str(self.resource.uri),
+				'size':size,
+				'digest':digest,
+				'ranges':[ (start, min(start + part_size, size) - 1) for start in range(0, size, part_size) ],
+				'done':[]
+			}
+			state['done'] = [ 0 for part in state['ranges'] ]
+			with open(path, 'wb') as f:
+				f.truncate(size)
+		resumed = sum(state['done'])
+		lock = threading.Lock()
+
+		def save():
+			with lock:
+				with open('%s.tmp' % sidecar, 'w') as f:
+					json.dump(state, f)
+				os.replace('%s.tmp' % sidecar, sidecar)
+
+		def fetch(part):
+			start, end = state['ranges'][part]
+			offset = start + state['done'][part]
+			if offset > end:
+				return
+			response = self.range(offset, end)
+			try:
+				with open(path, 'r+b') as f:
+					f.seek(offset)
+					written = 0
+					for chunk in response.iter_content(chunk_size):
+						f.write(chunk)
+						written += len(chunk)
+
+						# record progress only of bytes flushed to file
+						if written >= checkpoint_size:
+							f.flush()
+							state['done'][part] += written
+							written = 0
+							save()
+					f.flush()
+					state['done'][part] += written
+			finally:
+				response.close()
+				save()
+
+		# retrieve remaining ranges concurrently
+		logger.debug('downloading %s bytes of %s to %s, %s already downloaded' % (size, self.resource.uri, path, resumed))
+		save()
+		with ThreadPoolExecutor(max_workers=parts) as executor:
+			list(executor.map(fetch, range(len(state['ranges']))))
+
+		# verify against digest from repository
+		verified = None
+		if verify and digest:
+			algorithm, expected = digest.split(':')[-2:]
+			file_hash = hashlib.new(algorithm)
+			with open(path, 'rb') as f:
+				for chunk in iter(lambda: f.read(chunk_size), b''):
+					file_hash.update(chunk)
+			if file_hash.hexdigest() != expected:
+				os.remove(sidecar)
+				os.replace(path, '%s.corrupt' % path)
+				raise Exception('downloaded binary data for %s does not match digest %s, moved to %s.corrupt' % (self.resource.uri, digest, path))
+			verified = True
+
+			# cache verified binary data
+			if binary_cache is not None and size <= binary_cache.max_bytes:
+				binary_cache.put_file(digest, path)
+
+		os.remove(sidecar)
+		return SimpleNamespace(path=path, size=size, resumed=resumed, verified=verified, elapsed=time.time() - stime)
+
+
+	def _repository_description(self):
+
+		'''
+		Size, digest, and mimetype of binary data in repository, as uploaded, or refreshed, else per RDF of resource
+
+		Args:
+			None
+
+		Returns:
+			(types.SimpleNamespace): size, digest, e.g. 'urn:sha1:...', and mimetype, each None if unknown
+		'''
+
+		if self._stored is not None:
+			return self._stored
+		graph, uri, prefixes = self.resource.rdf.graph, self.resource.uri, self.resource.rdf.prefixes
+		size = graph.value(uri, prefixes.premis.hasSize)
+		digest = graph.value(uri, prefixes.premis.hasMessageDigest)
+		mimetype = graph.value(uri, prefixes.ebucore.hasMimeType)
+		return SimpleNamespace(
+			size=int(size) if size is not None else None,
+			digest=str(digest) if digest is not None else None,
+			mimetype=str(mimetype) if mimetype is not None else None)
+
+
+	def _repository_size(self):
+
+		# size of binary data, per premis:hasSize, or None
+		return self._repository_description().size
+
+
+	def _repository_digest(self):
+
+		# digest of binary data, per premis:hasMessageDigest, e.g. 'urn:sha1:...', or None
+		return self._repository_description().digest
+
+
+	def _unchanged(self):
+
+		'''
+		Determine if binary data set for update matches binary data in repository, by digest and mimetype
+
+		Args:
+			None
+
+		Returns:
+			(bool)
+		'''
+
+		if not self.resource.exists:
+			return False
+		stored = self._repository_description()
+		if not stored.digest or stored.mimetype != self.mimetype:
+			return False
+
+		# sizes differ, without reading binary data
+		size = self._pending_size()
+		if stored.size is not None and size is not None and size != stored.size:
+			return False
+
+		algorithm, expected = stored.digest.split(':')[-2:]
+		return self._pending_digest(algorithm) == expected
+
+
+	def _pending_size(self):
+
+		'''
+		Size of binary data set for update, for bytes, or seekable file-like objects, without reading binary data
+
+		Args:
+			None
+
+		Returns:
+			(int): size in bytes from current position, or None if not known
+		'''
+
+		data = self.data
+		if isinstance(data, str):
+			return len(data.encode('utf-8'))
+		if isinstance(data, (bytes, bytearray)):
+			return len(data)
+
+		# seekable binary file-like object, returned to position
+		if isinstance(data, io.IOBase) and not isinstance(data, io.TextIOBase) and data.seekable():
+			position = data.tell()
+			size = data.seek(0, io.SEEK_END) - position
+			data.seek(position)
+			return size
+
+		return None
+
+
+	def _pending_digest(self, algorithm):
+
+		'''
+		Digest of binary data set for update, from self.digest if known, else computed for bytes, or seekable file-like objects
+
+		Reading a seekable file-like object to compute its digest is an extra pass over binary data, before the upload if it
+		has changed.  _unchanged() only computes it if the repository digest is known, and sizes match, and the SHA-1 digest
+		computed is then sent as the Digest header of the upload, in place of a request to verify the upload after.
+
+		Args:
+			algorithm (str): hashlib algorithm, e.g. 'sha1'
+
+		Returns:
+			(str): hex digest, or None if not known without reading binary data for upload, or self.digest is malformed
+		'''
+
+		# known digest, e.g. 'sha1=...', malformed digest treated as changed
+		if self.digest:
+			known_algorithm, separator, known_digest = self.digest.partition('=')
+			if not separator or not known_algorithm or not known_digest:
+				logger.debug('malformed digest %s, expecting e.g. sha1=..., treating binary data as changed' % self.digest)
+				return None
+			if known_algorithm.lower().replace('-', '') == algorithm:
+				return known_digest
+
+		# bytes
+		data = self.data
+		if isinstance(data, str):
+			data = data.encode('utf-8')
+		if isinstance(data, (bytes, bytearray)):
+			return hashlib.new(algorithm, data).hexdigest()
+
+		# seekable file-like object, returned to position
+		if hasattr(data, 'read') and hasattr(data, 'seekable') and data.seekable():
+			position = data.tell()
+			file_hash = hashlib.new(algorithm)
+			for chunk in iter(lambda: data.read(self.upload_chunk_size), data.read(0)):
+				file_hash.update(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+			data.seek(position)
+			if algorithm == 'sha1':
+				self._computed_digest = SimpleNamespace(data=data, digest=file_hash.hexdigest())
+			return file_hash.hexdigest()
+
+		return None
+
+
 # NonRDF Source
 class NonRDFSource(Resource):
 
@@ -1867,8 +4947,8 @@ class NonRDFSource(Resource):
 	An LDPR whose state is not represented in RDF. For example, these can be binary or text documents that do not have useful RDF representations.
 	https://www.w3.org/TR/ldp/
 
-	Note: When a pre-existing NonRDFSource is retrieved, the binary data is stored under self.binary.data as a
-	streamable requests object.
+	Note: When a pre-existing NonRDFSource is retrieved, the binary data is available under self.binary.data as a
+	streamable requests object, retrieved on first access.
 
 	Inherits:
 		Resource
@@ -2046,7 +5126,8 @@ class DirectContainer(Container):
 		super().__init__(repo, uri=uri, response=response)
 
 		# if resource does not yet exist, set rdf:type
-		self.add_triple(self.rdf.prefixes.rdf.type, self.rdf.prefixes.ldp.DirectContainer)
+		if not self.exists:
+			self.add_triple(self.rdf.prefixes.rdf.type, self.rdf.prefixes.ldp.DirectContainer)
 
 		# save membershipResource, hasMemberRelation
 		self.membershipResource = membershipResource
@@ -2092,7 +5173,8 @@ class IndirectContainer(Container):
 		super().__init__(repo, uri=uri, response=response)
 
 		# if resource does not yet exist, set rdf:type
-		self.add_triple(self.rdf.prefixes.rdf.type, self.rdf.prefixes.ldp.IndirectContainer)
+		if not self.exists:
+			self.add_triple(self.rdf.prefixes.rdf.type, self.rdf.prefixes.ldp.IndirectContainer)
 
 		# save membershipResource, hasMemberRelation
 		self.membershipResource = membershipResource
@@ -84,18 +84,22 @@ class PCDMCollection(_models.BasicContainer):
 		related_child.create(specify_uri=True)
 
 
-	def get_members(self):
+	def get_members(self, retrieve=False):
 
 		'''
 		get pcdm:hasMember for this resource, optionally retrieving resource payload
 
 		Args:
-			retrieve (bool): if True, issue .refresh() on resource thereby confirming existence and retrieving payload
+			retrieve (bool): if True, retrieve concurrently, and return resources instead of URIs, raising the first error encountered
 		'''
 
 		if self.exists and hasattr(self.rdf.triples, 'pcdm') and hasattr(self.rdf.triples.pcdm, 'hasMember'):
 			members = [ self.repo.parse_uri(uri) for uri in self.rdf.triples.pcdm.hasMember ]
 
+			# if retrieve, retrieve concurrently as resources
+			if retrieve:
+				members = self.repo._retrieve_resources(members)
+
 			# return
 			return members
 
@@ -103,18 +107,22 @@ class PCDMCollection(_models.BasicContainer):
 			return []
 
 
-	def get_related(self):
+	def get_related(self, retrieve=False):
 
 		'''
 		get ore:aggregates for this resource, optionally retrieving resource payload
 
 		Args:
-			retrieve (bool): if True, issue .refresh() on resource thereby confirming existence and retrieving payload
+			retrieve (bool): if True, retrieve concurrently, and return resources instead of URIs, raising the first error encountered
 		'''
 
 		if self.exists and hasattr(self.rdf.triples, 'ore') and hasattr(self.rdf.triples.ore, 'aggregates'):
 			related = [ self.repo.parse_uri(uri) for uri in self.rdf.triples.ore.aggregates ]
 
+			# if retrieve, retrieve concurrently as resources
+			if retrieve:
+				related = self.repo._retrieve_resources(related)
+
 			# return
 			return related
 
@@ -130,6 +138,27 @@ class PCDMCollection(_models.BasicContainer):
 		self.update_pcdm_relationship()
 
 
+	@property
+	def dirty(self):
+
+		'''
+		resource.dirty, or members or related changed since retrieved
+		'''
+
+		return super().dirty or set(self.members) != set(self._orig_members) or set(self.related) != set(self._orig_related)
+
+
+	def _translate_uris(self, repo, translate):
+
+		'''
+		resource._translate_uris(), translating members and related as well
+		'''
+
+		super()._translate_uris(repo, translate)
+		for attr in ['members', '_orig_members', 'related', '_orig_related']:
+			setattr(self, attr, [ translate(uri) for uri in getattr(self, attr) ])
+
+
 	def _post_refresh(self):
 
 		'''
@@ -180,6 +209,10 @@ class PCDMCollection(_models.BasicContainer):
 			proxy_obj = self.repo.get_resource(resource_uri)
 			proxy_obj.delete(remove_tombstone=True)
 
+		# members and related as sent are now original, such that changes are not sent again
+		self._orig_members = copy.deepcopy(self.members)
+		self._orig_related = copy.deepcopy(self.related)
+
 
 
 class PCDMObject(_models.BasicContainer):
@@ -211,6 +244,7 @@ class PCDMObject(_models.BasicContainer):
 		repo (Repository): instance of Repository class
 		uri (rdflib.term.URIRef,str): input URI
 		response (requests.models.Response): defaults None, but if passed, populate self.data, self.headers, self.status_code
+		retrieve_pcdm_links (bool): retained for compatibility, PCDM links are set as URIs, use self.get_members(retrieve=True), etc., to retrieve as resources
 	'''
 
 	def __init__(self, repo, uri=None, response=None, retrieve_pcdm_links=True):
@@ -219,13 +253,13 @@ class PCDMObject(_models.BasicContainer):
 		super().__init__(repo, uri=uri, response=response)
 
 		# members, related
-		self.members = self.get_members(retrieve=retrieve_pcdm_links)
+		self.members = self.get_members()
 		self._orig_members = copy.deepcopy(self.members)
-		self.files = self.get_files(retrieve=retrieve_pcdm_links)
+		self.files = self.get_files()
 		self._orig_files = copy.deepcopy(self.files)
-		self.associated = self.get_associated(retrieve=retrieve_pcdm_links)
+		self.associated = self.get_associated()
 		self._orig_associated = copy.deepcopy(self.associated)
-		self.related = self.get_related(retrieve=retrieve_pcdm_links)
+		self.related = self.get_related()
 		self._orig_related = copy.deepcopy(self.related)
 
 
@@ -280,12 +314,16 @@ class PCDMObject(_models.BasicContainer):
 		get pcdm:hasMember for this resource
 
 		Args:
-			retrieve (bool): if True, issue .refresh() on resource thereby confirming existence and retrieving payload
+			retrieve (bool): if True, retrieve concurrently, and return resources instead of URIs, raising the first error encountered
 		'''
 
 		if self.exists and hasattr(self.rdf.triples, 'pcdm') and hasattr(self.rdf.triples.pcdm, 'hasMember'):
 			members = [ self.repo.parse_uri(uri) for uri in self.rdf.triples.pcdm.hasMember ]
 
+			# if retrieve, retrieve concurrently as resources
+			if retrieve:
+				members = self.repo._retrieve_resources(members)
+
 			# return
 			return members
 
@@ -299,12 +337,16 @@ class PCDMObject(_models.BasicContainer):
 		get pcdm:hasFile for this resource
 
 		Args:
-			retrieve (bool): if True, issue .refresh() on resource thereby confirming existence and retrieving payload
+			retrieve (bool): if True, retrieve concurrently, and return resources instead of URIs, raising the first error encountered
 		'''
 
 		if self.exists and hasattr(self.rdf.triples, 'pcdm') and hasattr(self.rdf.triples.pcdm, 'hasFile'):
 			files = [ self.repo.parse_uri(uri) for uri in self.rdf.triples.pcdm.hasFile ]
 
+			# if retrieve, retrieve concurrently as resources
+			if retrieve:
+				files = self.repo._retrieve_resources(files)
+
 			# return
 			return files
 
@@ -318,12 +360,16 @@ class PCDMObject(_models.BasicContainer):
 		get pcdm:hasRelatedFile for this resource
 
 		Args:
-			retrieve (bool): if True, issue .refresh() on resource thereby confirming existence and retrieving payload
+			retrieve (bool): if True, retrieve concurrently, and return resources instead of URIs, raising the first error encountered
 		'''
 
 		if self.exists and hasattr(self.rdf.triples, 'pcdm') and hasattr(self.rdf.triples.pcdm, 'hasRelatedFile'):
 			files = [ self.repo.parse_uri(uri) for uri in self.rdf.triples.pcdm.hasRelatedFile ]
 
+			# if retrieve, retrieve concurrently as resources
+			if retrieve:
+				files = self.repo._retrieve_resources(files)
+
 			# return
 			return files
 
@@ -337,12 +383,16 @@ class PCDMObject(_models.BasicContainer):
 		get ore:aggregates for this resource
 
 		Args:
-			retrieve (bool): if True, issue .refresh() on resource thereby confirming existence and retrieving payload
+			retrieve (bool): if True, retrieve concurrently, and return resources instead of URIs, raising the first error encountered
 		'''
 
 		if self.exists and hasattr(self.rdf.triples, 'ore') and hasattr(self.rdf.triples.ore, 'aggregates'):
 			related = [ self.repo.parse_uri(uri) for uri in self.rdf.triples.ore.aggregates ]
 
+			# if retrieve, retrieve concurrently as resources
+			if retrieve:
+				related = self.repo._retrieve_resources(related)
+
 			# return
 			return related
 
@@ -358,6 +408,27 @@ class PCDMObject(_models.BasicContainer):
 		self.update_pcdm_relationship()
 
 
+	@property
+	def dirty(self):
+
+		'''
+		resource.dirty, or members or related changed since retrieved
+		'''
+
+		return super().dirty or set(self.members) != set(self._orig_members) or set(self.related) != set(self._orig_related)
+
+
+	def _translate_uris(self, repo, translate):
+
+		'''
+		resource._translate_uris(), translating members, files, associated, and related as well
+		'''
+
+		super()._translate_uris(repo, translate)
+		for attr in ['members', '_orig_members', 'files', '_orig_files', 'associated', '_orig_associated', 'related', '_orig_related']:
+			setattr(self, attr, [ translate(uri) for uri in getattr(self, attr) ])
+
+
 	def _post_refresh(self):
 
 		'''
@@ -408,6 +479,10 @@ class PCDMObject(_models.BasicContainer):
 			proxy_obj = self.repo.get_resource(resource_uri)
 			proxy_obj.delete(remove_tombstone=True)
 
+		# members and related as sent are now original, such that changes are not sent again
+		self._orig_members = copy.deepcopy(self.members)
+		self._orig_related = copy.deepcopy(self.related)
+
 
 
 class PCDMFile(_models.NonRDFSource):
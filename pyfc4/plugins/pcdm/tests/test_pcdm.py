@@ -90,6 +90,7 @@ class TestCRUD(object):
 
 		# add green and yellow to colors collection
 		colors.members.extend([green.uri, yellow.uri])
+		assert colors.dirty
 		colors.update()
 
 		# refresh colors and confirm as members
@@ -98,6 +99,27 @@ class TestCRUD(object):
 		assert yellow.uri in colors.members
 
 
+	def test_retrieve_members(self):
+
+		# retrieve members as resources
+		members = colors.get_members(retrieve=True)
+		assert set([ member.uri for member in members ]) == set([green.uri, yellow.uri])
+		assert all([ type(member) == pcdm.models.PCDMObject for member in members ])
+
+		# errors retrieving members are raised, not returned as members
+		get_resources = repo.get_resources
+		def failing_get_resources(uris, *args, **kwargs):
+			for uri in uris:
+				yield uri, Exception('could not retrieve %s' % uri)
+		repo.get_resources = failing_get_resources
+		try:
+			with pytest.raises(Exception) as excinfo:
+				colors.get_members(retrieve=True)
+			assert 'could not retrieve' in str(excinfo.value)
+		finally:
+			repo.get_resources = get_resources
+
+
 	def test_relate_objects(self):
 
 		# make green and yellow related
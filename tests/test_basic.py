@@ -4,8 +4,13 @@ from pyfc4.models import *
 
 from tests import localsettings
 
+import asyncio
 import datetime
+import hashlib
 import inspect
+import io
+import json
+import os
 import pdb
 import pytest
 import rdflib
@@ -41,6 +46,42 @@ fast_repo = Repository(
 
 
 
+# requests issued by repositories and transactions
+class RequestLog(list):
+
+	'''
+	Requests issued, as (verb, uri), with failures to inject as (verb, uri suffix, status code)
+	'''
+
+	def __init__(self):
+		super().__init__()
+		self.failures = []
+
+
+	def fail(self, verb, suffix, status_code=500):
+
+		# respond to matching requests with status code, without sending them
+		self.failures.append((verb, suffix, status_code))
+
+
+@pytest.fixture
+def http_requests(monkeypatch):
+
+	log = RequestLog()
+	http_request = API.http_request
+	def logged_http_request(api, verb, uri, *args, **kwargs):
+		log.append((verb, uri))
+		for failing_verb, suffix, status_code in log.failures:
+			if verb == failing_verb and str(uri).endswith(suffix):
+				response = requests.models.Response()
+				response.status_code = status_code
+				return response
+		return http_request(api, verb, uri, *args, **kwargs)
+	monkeypatch.setattr(API, 'http_request', logged_http_request)
+	yield log
+
+
+
 ########################################################
 # SETUP
 ########################################################
@@ -226,6 +267,22 @@ class TestBasicCRUDPUT(object):
 		assert 'but repository reports this resource is' in str(excinfo.value)
 
 
+	# test resource type detected without additional requests
+	def test_resource_type_single_request(self, http_requests):
+
+		# container, one GET
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+		assert type(foo) == BasicContainer
+		assert len(http_requests) == 1
+		assert http_requests[0][0] == 'GET'
+
+		# binary, one GET for metadata, binary data not counted as metadata request
+		del http_requests[:]
+		baz = repo.get_resource('%s/foo/baz' % testing_container_uri, resource_type=None)
+		assert type(baz) == NonRDFSource
+		assert [ verb for verb, uri in http_requests ].count('HEAD') == 0
+
+
 class TestURIParsing(object):
 
 	'''
@@ -573,6 +630,110 @@ class TestTransactions(object):
 		assert not zingfoo2
 
 
+	def test_transaction_shares_repository(self):
+
+		# state of repository shared by reference
+		txn = repo.start_txn(auto_keep_alive=False)
+		assert txn.repo is repo
+		assert txn.session is repo.session
+		assert txn.namespace_manager is repo.namespace_manager
+		assert txn._resource_type_cache is repo._resource_type_cache
+		assert txn.custom_resource_type_parser is repo.custom_resource_type_parser
+		assert txn.api.repo is txn
+		assert txn.root.endswith('/')
+		assert txn.parse_uri('foo') == rdflib.term.URIRef('%sfoo' % txn.root)
+
+		# default_auto_refresh not inherited
+		assert repo.default_auto_refresh and not txn.default_auto_refresh
+		txn.rollback()
+		txn = repo.start_txn(default_auto_refresh=True)
+		assert txn.default_auto_refresh
+		txn.rollback()
+
+
+	def test_transaction_uri_translation(self):
+
+		txn = repo.start_txn(auto_keep_alive=False)
+		zingbar = BasicContainer(txn, '%s/zingbar' % testing_container_uri)
+		zingbar.create(specify_uri=True)
+		zingbaz = BasicContainer(txn, '%s/zingbar/zingbaz' % testing_container_uri)
+		zingbaz.create(specify_uri=True)
+		zingbar.refresh()
+		assert txn.to_canonical_uri(zingbar.uri) == repo.parse_uri('%s/zingbar' % testing_container_uri)
+		assert txn.to_txn_uri(repo.parse_uri('%s/zingbar' % testing_container_uri)) == zingbar.uri
+
+		# local change, not yet sent
+		zingbar.add_triple(zingbar.rdf.prefixes.dc.subject, zingbaz.uri)
+		txn.commit()
+
+		# resources rebound to repository, with URIs translated
+		zingbar_uri = repo.parse_uri('%s/zingbar' % testing_container_uri)
+		zingbaz_uri = repo.parse_uri('%s/zingbar/zingbaz' % testing_container_uri)
+		assert zingbar.repo is repo
+		assert zingbar.uri == zingbar_uri
+		assert zingbaz.uri == zingbaz_uri
+		assert zingbar.children() == [zingbaz_uri]
+		assert not [ term for triple in zingbar.rdf.graph for term in triple if str(term).startswith(txn.root) ]
+		assert not [ term for triple in zingbar._orig_graph() for term in triple if str(term).startswith(txn.root) ]
+		assert zingbar.rdf.triples.dc.subject == [zingbaz_uri]
+
+		# local change sent at repository URIs
+		zingbar.update()
+		zingbar.refresh()
+		assert zingbar.rdf.triples.dc.subject == [zingbaz_uri]
+
+
+	def test_keep_alive(self):
+
+		# not kept alive unless requested
+		txn = repo.start_txn()
+		assert txn._keep_alive_thread is None
+		txn.rollback()
+
+		# kept alive from background thread, ahead of expiration
+		txn = repo.start_txn(auto_keep_alive=True)
+		assert 0 < txn.expires_in() <= 180
+		expires = txn.expires
+		txn.keep_alive_margin = 179
+		txn.keep_alive_min_delay = 1
+		txn.stop_keep_alive()
+		txn.start_keep_alive()
+		time.sleep(2.5)
+		assert txn.expires != expires
+
+		# expiration measured from Date header, not local clock
+		txn._set_expires('Thu, 03 Aug 2017 19:42:32 GMT', 'Thu, 03 Aug 2017 19:40:32 GMT')
+		assert 119 < txn.expires_in() <= 120
+
+		# unknown expiration, fallback delay rather than immediate keep-alive requests
+		txn._set_expires('not a date')
+		assert txn.expires_in() is None
+
+		# stopped on commit
+		txn.commit()
+		assert not txn._keep_alive_thread.is_alive()
+
+
+	def test_transaction_context_manager(self):
+
+		# committed on exit
+		with repo.start_txn() as txn:
+			zingfoo3 = BasicContainer(txn, '%s/zingfoo3' % testing_container_uri)
+			zingfoo3.create(specify_uri=True)
+		assert not txn.active
+		assert repo.get_resource('%s/zingfoo3' % testing_container_uri)
+
+		# rolled back on exception
+		with pytest.raises(ValueError):
+			with repo.start_txn(auto_keep_alive=True) as txn:
+				zingfoo4 = BasicContainer(txn, '%s/zingfoo4' % testing_container_uri)
+				zingfoo4.create(specify_uri=True)
+				raise ValueError('rollback')
+		assert not txn.active
+		assert not txn._keep_alive_thread.is_alive()
+		assert not repo.get_resource('%s/zingfoo4' % testing_container_uri)
+
+
 
 # test moving/copying
 class TestMovingCopying(object):
@@ -701,15 +862,19 @@ class TestUpdatesRefresh(object):
 
 		# add triple, but confirm no refresh
 		foo = repo.get_resource('%s/foo' % testing_container_uri)
+		graph = foo.rdf.graph
 		foo.add_triple(foo.rdf.prefixes.test.favorite_number, 42)
 		foo.update(auto_refresh=False)
 
-		# assert graph diff still shows triple added (which would not be present after refresh)
+		# assert same graph kept (which would be replaced by refresh), with triple added as original
+		assert foo.rdf.graph is graph
+		assert 42 in [ o.toPython() for o in foo.rdf.graph.objects(foo.uri, foo.rdf.prefixes.test.favorite_number) ]
 		foo._diff_graph()
-		assert len(list(foo.rdf.diffs.added)) == 1
+		assert len(list(foo.rdf.diffs.added)) == 0
 
-		# refresh, then assert zero
+		# refresh, then assert graph replaced, and still zero
 		foo.refresh()
+		assert foo.rdf.graph is not graph
 		foo._diff_graph()
 		assert len(list(foo.rdf.diffs.added)) == 0
 
@@ -757,6 +922,1009 @@ class TestUpdatesRefresh(object):
 
 
 
+# change journal
+class TestChangeJournal(object):
+
+	def test_journal_update(self, http_requests):
+
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+
+		# adding then removing a triple cancels out, no PATCH sent
+		foo.add_triple(foo.rdf.prefixes.dc.title, 'journaled')
+		foo.remove_triple(foo.rdf.prefixes.dc.title, 'journaled')
+		foo._diff_graph()
+		assert len(list(foo.rdf.diffs.added)) == 0
+		assert len(list(foo.rdf.diffs.removed)) == 0
+		del http_requests[:]
+		foo.update(auto_refresh=False)
+		assert [ verb for verb, uri in http_requests ].count('PATCH') == 0
+
+		# set_triple journals only net changes
+		foo.set_triple(foo.rdf.prefixes.dc.title, 'journaled')
+		foo._diff_graph()
+		assert len(list(foo.rdf.diffs.added)) == 1
+		foo.update(auto_refresh=True)
+		assert [ verb for verb, uri in http_requests ].count('PATCH') == 1
+
+		# confirm update
+		assert foo.rdf.triples.dc.title[0].toPython() == 'journaled'
+
+
+	def test_journal_fallback(self):
+
+		# replacing graph falls back to full graph diff
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+		graph = rdflib.Graph()
+		graph += foo.rdf.graph
+		graph.add((foo.uri, foo.rdf.prefixes.dc.title, rdflib.term.Literal('replaced graph')))
+		foo.rdf.graph = graph
+		foo._diff_graph()
+		assert len(list(foo.rdf.diffs.added)) == 1
+
+
+	def test_journal_original_graph(self):
+
+		# original graph is derived from journal, not copied
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+		orig_len = len(foo.rdf.graph)
+		foo.add_triple(foo.rdf.prefixes.dc.title, 'not original')
+		assert len(foo._orig_graph()) == orig_len
+
+		# blank nodes invalidate journal, original graph is snapshot before change
+		foo.rdf.graph.add((foo.uri, foo.rdf.prefixes.dc.relation, rdflib.BNode()))
+		assert not foo.rdf._store.journal.valid
+		assert len(foo._orig_graph()) == orig_len
+		foo._diff_graph()
+		assert len(list(foo.rdf.diffs.added)) == 2
+
+
+
+# object-like triples
+class TestObjectLikeTriples(object):
+
+	def test_incremental_triples(self):
+
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+
+		# added triples show up without auto_refresh, duplicates ignored
+		foo.add_triple(foo.rdf.prefixes.dc.subject, 'incremental', auto_refresh=False)
+		foo.add_triple(foo.rdf.prefixes.dc.subject, 'incremental', auto_refresh=False)
+		assert foo.rdf.triples.dc.subject.count(rdflib.term.Literal('incremental', datatype=rdflib.XSD.string)) == 1
+
+		# set and removed triples are reflected, and emptied predicates removed
+		foo.set_triple(foo.rdf.prefixes.foaf.nick, 'one')
+		foo.set_triple(foo.rdf.prefixes.foaf.nick, 'two')
+		assert foo.rdf.triples.foaf.nick == [rdflib.term.Literal('two', datatype=rdflib.XSD.string)]
+		foo.remove_triple(foo.rdf.prefixes.foaf.nick, 'two')
+		assert not hasattr(foo.rdf.triples, 'foaf')
+
+		# replaced graph is parsed on access
+		graph = rdflib.Graph()
+		graph.bind('foaf', foo.rdf.prefixes.foaf)
+		graph += foo.rdf.graph
+		graph.add((foo.uri, foo.rdf.prefixes.foaf.nick, rdflib.term.Literal('three')))
+		foo.rdf.graph = graph
+		assert foo.rdf.triples.foaf.nick == [rdflib.term.Literal('three')]
+
+
+	def test_lazy_rdf(self):
+
+		# RDF not parsed when retrieved
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+		assert foo.exists
+		assert foo._rdf is None
+
+		# parsed on first access
+		assert len(foo.rdf.graph) > 0
+		assert foo._rdf is not None
+
+		# refresh does not parse if not yet accessed
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+		foo.refresh()
+		assert foo._rdf is None
+		assert hasattr(foo.rdf.triples, 'ldp')
+
+
+
+# bulk retrieval
+class TestGetResources(object):
+
+	def test_get_resources(self):
+
+		uris = [
+			'%s/foo' % testing_container_uri,
+			'%s/foo/bar' % testing_container_uri,
+			'%s/foo/does_not_exist' % testing_container_uri,
+			'%s/foo/baz' % testing_container_uri]
+
+		# ordered, missing resources reported as False
+		results = list(repo.get_resources(uris, max_workers=2))
+		assert [ uri for uri, resource in results ] == uris
+		assert type(results[0][1]) == BasicContainer
+		assert results[2][1] == False
+		assert type(results[3][1]) == NonRDFSource
+
+		# unordered, all yielded
+		results = dict(repo.get_resources(uris, max_workers=2, ordered=False))
+		assert set(results.keys()) == set(uris)
+
+
+	def test_children_parents_as_resources(self):
+
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+		children = foo.children(as_resources=True)
+		assert [ child.uri for child in children ] == foo.children()
+		bar = repo.get_resource('%s/foo/bar' % testing_container_uri)
+		assert bar.parents(as_resources=True)[0].uri == foo.uri
+
+
+
+# iterating children
+class TestIterChildren(object):
+
+	def test_iter_children(self):
+
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+		children = foo.children()
+
+		# URIs
+		assert list(foo.iter_children()) == children
+
+		# resources, in order
+		resources = list(foo.iter_children(as_resources=True, prefetch=2))
+		assert [ resource.uri for resource in resources ] == children
+
+		# batches
+		batches = list(foo.iter_children(batch_size=1))
+		assert len(batches) == len(children)
+		assert batches[0] == children[:1]
+
+
+
+# embedded children
+class TestEmbeddedChildren(object):
+
+	def test_embed_children(self, http_requests):
+
+		foo = repo.get_resource('%s/foo' % testing_container_uri, embed_children=True)
+		children = foo.children(as_resources=True)
+		metadata_requests = [ uri for verb, uri in http_requests if verb in ['GET','HEAD'] and uri.endswith('fcr:metadata') ]
+		assert len(metadata_requests) == 1
+
+		# children typed, with own graphs
+		assert [ child.uri for child in children ] == foo.children()
+		bar = [ child for child in children if child.uri.endswith('/foo/bar') ][0]
+		baz = [ child for child in children if child.uri.endswith('/foo/baz') ][0]
+		assert type(bar) == BasicContainer
+		assert type(baz) == NonRDFSource
+		assert bar.exists
+		assert set(bar.rdf.graph.subjects()) == set([bar.uri])
+		assert baz.binary.mimetype == 'text/plain'
+
+		# graph of parent only includes own triples
+		assert set(foo.rdf.graph.subjects()) == set([foo.uri])
+
+
+
+# partial resources
+class TestOmitTriples(object):
+
+	def test_omit_containment(self):
+
+		# retrieve without containment or server managed triples
+		foo = repo.get_resource('%s/foo' % testing_container_uri, omit=['containment','server_managed'])
+		assert foo.partial
+		assert not hasattr(foo.rdf.triples, 'ldp') or not hasattr(foo.rdf.triples.ldp, 'contains')
+		assert not hasattr(foo.rdf.triples, 'fedora') or not hasattr(foo.rdf.triples.fedora, 'hasParent')
+		with pytest.raises(Exception) as excinfo:
+			foo.children()
+		assert 'containment triples omitted' in str(excinfo.value)
+
+		# update partial resource, refresh keeps omitting
+		foo.add_triple(foo.rdf.prefixes.dc.subject, 'partial')
+		assert 'partial' in foo.update(sparql_query_only=True)
+		assert 'contains' not in foo.update(sparql_query_only=True)
+		foo.update()
+		assert foo.partial
+		assert rdflib.term.Literal('partial', datatype=rdflib.XSD.string) in foo.rdf.triples.dc.subject
+		assert not hasattr(foo.rdf.triples, 'ldp') or not hasattr(foo.rdf.triples.ldp, 'contains')
+
+		# full resource retains children, and update
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+		assert not foo.partial
+		assert len(foo.children()) > 0
+		assert rdflib.term.Literal('partial', datatype=rdflib.XSD.string) in foo.rdf.triples.dc.subject
+
+		# unknown preference
+		with pytest.raises(Exception) as excinfo:
+			repo.get_resource('%s/foo' % testing_container_uri, omit=['everything'])
+		assert 'cannot omit' in str(excinfo.value)
+
+
+
+# tree walking
+class TestWalk(object):
+
+	def test_walk(self):
+
+		# all resources beneath testing container
+		records = list(repo.walk(testing_container_uri, concurrency=4))
+		uris = [ record.uri for record in records ]
+		assert records[0].uri == repo.parse_uri(testing_container_uri)
+		assert records[0].depth == 0
+		assert repo.parse_uri('%s/foo/bar' % testing_container_uri) in uris
+		assert len(uris) == len(set(uris))
+		baz = [ record for record in records if record.uri == repo.parse_uri('%s/foo/baz' % testing_container_uri) ][0]
+		assert baz.resource_type == NonRDFSource
+		assert baz.parent == repo.parse_uri('%s/foo' % testing_container_uri)
+		assert baz.depth == 2
+
+		# max_depth
+		records = list(repo.walk(testing_container_uri, max_depth=1))
+		assert max([ record.depth for record in records ]) == 1
+
+		# filter prunes records and descendants
+		records = list(repo.walk(testing_container_uri, filter=lambda record: not record.uri.endswith('/foo')))
+		assert repo.parse_uri('%s/foo/bar' % testing_container_uri) not in [ record.uri for record in records ]
+
+
+	def test_walk_bounded_queue(self):
+
+		# wide tree, 20 children of 2 children each
+		wide = [ BasicContainer(repo, '%s/wide' % testing_container_uri) ]
+		wide.extend([ BasicContainer(repo, '%s/wide/%s' % (testing_container_uri, x)) for x in range(20) ])
+		wide.extend([ BasicContainer(repo, '%s/wide/%s/%s' % (testing_container_uri, x, y)) for x in range(20) for y in range(2) ])
+		repo.create_many(wide)
+
+		# unbounded, every parent listed waits in queue
+		records = list(repo.walk('%s/wide' % testing_container_uri, concurrency=2))
+		assert len(records) == 61
+		assert max([ record.queued for record in records ]) > 15
+
+		# bounded, descends once max_queued parents waiting, and still visits all
+		records = list(repo.walk('%s/wide' % testing_container_uri, concurrency=2, max_queued=3))
+		assert len(records) == 61
+		assert max([ record.queued for record in records ]) <= 3 + 2 * 2
+		repo.delete_many(['%s/wide' % testing_container_uri])
+
+
+
+# lazy binary data
+class TestLazyBinary(object):
+
+	def test_lazy_binary(self):
+
+		# binary data not retrieved with resource
+		baz = repo.get_resource('%s/foo/baz' % testing_container_uri)
+		assert baz.binary._lazy_data
+		assert baz.binary.mimetype == 'text/plain'
+		assert baz.binary._lazy_data
+
+		# retrieved on first access
+		content = baz.binary.data.content
+		assert type(baz.binary._data) == requests.models.Response
+
+		# iterate, releasing connection
+		assert b''.join(baz.binary.iter_content(5)) == content
+		assert baz.binary._lazy_data
+
+		# open as file-like object
+		with baz.binary.open() as f:
+			assert f.read() == content
+		assert baz.binary._lazy_data
+
+		# binary data set locally, is not retrieved
+		baz.binary.data = 'local'
+		assert baz.binary.data == 'local'
+		assert baz.binary._pending()
+
+
+
+# streaming uploads
+class TestStreamingUpload(object):
+
+	def test_streaming_upload(self):
+
+		content = bytes(range(256)) * 1000
+
+		# file-like object, streamed in chunks, and verified after upload
+		streamed = Binary(repo, '%s/foo/streamed' % testing_container_uri)
+		streamed.binary.data = io.BytesIO(content)
+		streamed.binary.mimetype = 'application/octet-stream'
+		streamed.binary.upload_chunk_size = 10000
+		streamed.create(specify_uri=True)
+		stats = streamed.binary.upload_stats
+		assert stats.bytes == len(content)
+		assert stats.digests['sha1'] == hashlib.sha1(content).hexdigest()
+		assert stats.digests['md5'] == hashlib.md5(content).hexdigest()
+		assert not stats.digest_sent
+		assert stats.verified
+		assert repo.get_resource(streamed.uri).binary.data.content == content
+
+		# iterator, on update
+		streamed = repo.get_resource(streamed.uri)
+		streamed.binary.data = ( content[x:x+1000] for x in range(0, len(content), 1000) )
+		streamed.binary.mimetype = 'application/octet-stream'
+		streamed.update()
+		assert streamed.binary.upload_stats.bytes == len(content)
+		assert streamed.binary.upload_stats.verified
+
+
+	def test_upload_digest(self):
+
+		# bytes, digest sent
+		digested = Binary(repo, '%s/foo/digested' % testing_container_uri)
+		digested.binary.data = b'digested'
+		digested.binary.mimetype = 'text/plain'
+		digested.create(specify_uri=True)
+		assert digested.binary.upload_stats.digest_sent
+		assert digested.binary.upload_stats.verified
+
+		# known digest, not matching, rejected by repository
+		mismatched = Binary(repo, '%s/foo/mismatched' % testing_container_uri)
+		mismatched.binary.data = io.BytesIO(b'mismatched')
+		mismatched.binary.mimetype = 'text/plain'
+		mismatched.binary.digest = 'sha1=%s' % hashlib.sha1(b'something else').hexdigest()
+		with pytest.raises(Exception):
+			mismatched.create(specify_uri=True)
+		assert not repo.get_resource(mismatched.uri)
+
+
+	def test_upload_verification(self, http_requests):
+
+		content = bytes(range(256)) * 1000
+		streamed = fast_repo.get_resource('%s/foo/streamed' % testing_container_uri)
+
+		# verification skipped, of different size such that digest is not computed before upload
+		streamed.binary.verify_upload = False
+		streamed.binary.data = io.BytesIO(content[::-1][1:])
+		streamed.update()
+		assert streamed.binary.upload_stats.verified is None
+		streamed.binary.verify_upload = True
+
+		# failed verification raises, and digest in repository is not assumed, so same binary data is not skipped as unchanged
+		finish_upload = streamed.binary._finish_upload
+		def corrupting_finish_upload(response):
+			finish_upload(response)
+			streamed.binary.upload_stats.digests['sha1'] = hashlib.sha1(b'something else').hexdigest()
+		streamed.binary._finish_upload = corrupting_finish_upload
+		streamed.binary.data = io.BytesIO(content)
+		with pytest.raises(Exception) as excinfo:
+			streamed.update()
+		assert 'remains in repository' in str(excinfo.value)
+		assert streamed.binary._stored.digest == 'urn:sha1:%s' % hashlib.sha1(content).hexdigest()
+		assert streamed.binary._stored.digest != 'urn:sha1:%s' % streamed.binary.upload_stats.digests['sha1']
+
+		# verified, against description retrieved after upload, without further request
+		streamed.binary._finish_upload = finish_upload
+		streamed.binary.data = io.BytesIO(content[1:])
+		del http_requests[:]
+		streamed.update()
+		assert streamed.binary.upload_stats.verified
+		assert streamed.binary._stored.digest == 'urn:sha1:%s' % hashlib.sha1(content[1:]).hexdigest()
+		assert [ verb for verb, uri in http_requests ] == ['PUT', 'GET']
+
+
+
+# unchanged binary updates
+class TestUnchangedBinary(object):
+
+	def test_skip_unchanged_binary(self):
+
+		digested = fast_repo.get_resource('%s/foo/digested' % testing_container_uri)
+
+		# same bytes, PUT skipped
+		digested.binary.data = b'digested'
+		digested.update()
+		assert digested.binary.upload_stats is None
+		assert digested.binary.data.content == b'digested'
+
+		# same bytes from file-like object, PUT skipped, and position kept
+		f = io.BytesIO(b'digested')
+		digested.binary.data = f
+		digested.update()
+		assert digested.binary.upload_stats is None
+		assert f.tell() == 0
+
+		# changed bytes, uploaded
+		digested.binary.data = b'changed'
+		digested.update()
+		assert digested.binary.upload_stats.bytes == 7
+
+		# original bytes again, compared with bytes as uploaded, not as first retrieved
+		digested.binary.data = b'digested'
+		digested.update()
+		assert digested.binary.upload_stats.bytes == 8
+		assert repo.get_resource(digested.uri).binary.data.content == b'digested'
+
+		# changed mimetype, uploaded
+		digested.binary.data = b'digested'
+		digested.binary.mimetype = 'text/csv'
+		digested.update()
+		assert repo.get_resource(digested.uri).binary.mimetype == 'text/csv'
+
+
+	def test_unchanged_binary_single_read(self):
+
+		class CountingBytesIO(io.BytesIO):
+			reads = 0
+			def read(self, *args):
+				self.reads += 1
+				return super().read(*args)
+
+		digested = fast_repo.get_resource('%s/foo/digested' % testing_container_uri)
+		digested.binary.mimetype = 'text/csv'
+
+		# file-like object of different size, not read before upload
+		f = CountingBytesIO(b'resized')
+		digested.binary.data = f
+		digested.update()
+		assert f.reads == 3 # single pass: empty read for sentinel, one chunk, and end of file
+		assert not digested.binary.upload_stats.digest_sent
+
+		# file-like object of same size, changed, digest computed before upload sent for repository to verify
+		digested.binary.data = CountingBytesIO(b'changed')
+		digested.update()
+		assert digested.binary.upload_stats.digest_sent
+		assert digested.binary.upload_stats.verified
+		assert repo.get_resource(digested.uri).binary.data.content == b'changed'
+
+		# malformed digest treated as changed
+		digested.binary.data = b'changed'
+		digested.binary.digest = 'not a digest'
+		assert not digested.binary._unchanged()
+		digested.binary.digest = None
+
+
+
+# ranged downloads
+class TestDownload(object):
+
+	def test_download(self, tmpdir):
+
+		# binary of 100KB
+		content = bytes(range(256)) * 400
+		large = Binary(repo, '%s/foo/large' % testing_container_uri)
+		large.binary.data = content
+		large.binary.mimetype = 'application/octet-stream'
+		large.create(specify_uri=True)
+		large = repo.get_resource(large.uri)
+
+		# download in parts
+		path = str(tmpdir.join('large'))
+		download = large.binary.download(path, parts=3, chunk_size=4096)
+		assert download.verified
+		assert download.resumed == 0
+		assert open(path, 'rb').read() == content
+		assert not os.path.exists('%s.download' % path)
+
+
+	def test_download_resume(self, tmpdir):
+
+		large = repo.get_resource('%s/foo/large' % testing_container_uri)
+		path = str(tmpdir.join('large'))
+		large.binary.download(path, parts=2)
+
+		# interrupted after first part
+		state = {
+			'uri':str(large.uri),
+			'size':102400,
+			'digest':large.binary._repository_digest(),
+			'ranges':[(0, 51199), (51200, 102399)],
+			'done':[51200, 0]
+		}
+		with open('%s.download' % path, 'w') as f:
+			json.dump(state, f)
+		with open(path, 'r+b') as f:
+			f.seek(51200)
+			f.write(b'\x00' * 51200)
+
+		# resumes, and verifies
+		download = large.binary.download(path, parts=2)
+		assert download.resumed == 51200
+		assert download.verified
+		assert open(path, 'rb').read() == bytes(range(256)) * 400
+
+
+	def test_download_corrupt(self, tmpdir):
+
+		# digest not matching binary data
+		large = repo.get_resource('%s/foo/large' % testing_container_uri)
+		large.binary._stored = SimpleNamespace(size=102400, digest='urn:sha1:%s' % hashlib.sha1(b'something else').hexdigest(), mimetype=None)
+
+		# raises, and moves file aside
+		path = str(tmpdir.join('large'))
+		with pytest.raises(Exception) as excinfo:
+			large.binary.download(path, parts=2, checkpoint_size=4096)
+		assert 'does not match digest' in str(excinfo.value)
+		assert not os.path.exists(path)
+		assert not os.path.exists('%s.download' % path)
+		assert os.path.exists('%s.corrupt' % path)
+
+
+
+# content addressed binary cache
+class TestBinaryCache(object):
+
+	def test_binary_cache(self, tmpdir):
+
+		binary_cache = BinaryCache(str(tmpdir.join('cache')), max_bytes=250000)
+		cached_repo = Repository(
+			localsettings.REPO_ROOT,
+			localsettings.REPO_USERNAME,
+			localsettings.REPO_PASSWORD,
+			binary_cache=binary_cache)
+
+		# first read retrieves and caches, second read served from disk
+		content = bytes(range(256)) * 400
+		large = cached_repo.get_resource('%s/foo/large' % testing_container_uri)
+		assert large.binary.data.content == content
+		assert binary_cache.stats()['files'] == 1
+		large = cached_repo.get_resource(large.uri)
+		assert large.binary.data.content == content
+		assert binary_cache.hits == 1
+		large = cached_repo.get_resource(large.uri)
+		with large.binary.open() as f:
+			assert f.read() == content
+
+		# download copied from cache
+		download = large.binary.download(str(tmpdir.join('large')))
+		assert download.verified
+		assert open(str(tmpdir.join('large')), 'rb').read() == content
+
+		# changed binary retrieved, and cached, under new digest
+		large.binary.data = content[::-1]
+		large.update()
+		large = cached_repo.get_resource(large.uri)
+		assert large.binary.data.content == content[::-1]
+		assert binary_cache.stats()['files'] == 2
+
+		# least recently used evicted beyond max_bytes
+		large.binary.data = content[:50000]
+		large.update()
+		assert cached_repo.get_resource(large.uri).binary.data.content == content[:50000]
+		assert binary_cache.evictions == 1
+		assert binary_cache.stats()['bytes'] <= 250000
+
+		# restore binary
+		large.binary.data = content
+		large.update()
+
+
+	def test_binary_cache_revalidate(self, tmpdir):
+
+		binary_cache = BinaryCache(str(tmpdir.join('cache')), revalidate=True)
+		cached_repo = Repository(
+			localsettings.REPO_ROOT,
+			localsettings.REPO_USERNAME,
+			localsettings.REPO_PASSWORD,
+			binary_cache=binary_cache)
+
+		# described before binary changed elsewhere
+		large = cached_repo.get_resource('%s/foo/large' % testing_container_uri)
+		large.binary.data.content
+		stale = cached_repo.get_resource(large.uri)
+		changed = repo.get_resource(large.uri)
+		changed.binary.data = b'changed'
+		changed.update()
+
+		# revalidation fails, changed binary retrieved
+		assert stale.binary.data.content == b'changed'
+
+		# restore binary
+		changed.binary.data = bytes(range(256)) * 400
+		changed.update()
+
+
+
+# bulk creation
+class TestCreateMany(object):
+
+	def test_create_many(self):
+
+		# children listed before parents, and intermediate paths not created
+		uris = ['bulk/a/b/c', 'bulk/a/b', 'bulk/a', 'bulk/d/e', 'bulk']
+		resources = [ BasicContainer(repo, '%s/%s' % (testing_container_uri, uri)) for uri in uris ]
+		report = repo.create_many(resources, max_workers=4)
+		assert [ result.resource for result in report ] == resources
+		assert all([ result.created for result in report ])
+		assert report[0].parent == resources[1].uri
+		assert report[3].parent == resources[4].uri
+		assert report[4].parent == None
+		for resource in resources:
+			assert repo.get_resource(resource.uri)
+
+
+	def test_create_many_errors(self):
+
+		# failed parent, children not attempted
+		parent = BasicContainer(repo, '%s/bulk/f' % testing_container_uri)
+		parent.exists = True
+		child = BasicContainer(repo, '%s/bulk/f/g' % testing_container_uri)
+		sibling = BasicContainer(repo, '%s/bulk/h' % testing_container_uri)
+		report = repo.create_many([child, parent, sibling])
+		assert [ result.created for result in report ] == [False, False, True]
+		assert report[1].error
+		assert report[0].error
+		assert not repo.get_resource(child.uri)
+
+
+	def test_create_many_txn(self):
+
+		# committed
+		resources = [ BasicContainer(repo, '%s/bulk/txn/%s' % (testing_container_uri, x)) for x in range(3) ]
+		report = repo.create_many(resources, use_txn=True)
+		assert all([ result.created for result in report ])
+		assert [ resource.uri for resource in resources ] == [ result.uri for result in report ]
+		assert resources[0].repo is repo
+		for resource in resources:
+			assert repo.get_resource(resource.uri)
+
+		# rolled back
+		failed = BasicContainer(repo, '%s/bulk/txn/failed' % testing_container_uri)
+		failed.exists = True
+		resources = [ BasicContainer(repo, '%s/bulk/txn/rolled' % testing_container_uri), failed ]
+		report = repo.create_many(resources, use_txn=True)
+		assert not any([ result.created for result in report ])
+		assert not repo.get_resource(resources[0].uri)
+
+		# rolled back resources bound to repository, as not existing, and may be created again
+		assert resources[0].repo is repo
+		assert resources[0].uri == repo.parse_uri('%s/bulk/txn/rolled' % testing_container_uri)
+		assert not resources[0].exists
+		report = repo.create_many(resources[:1], use_txn=True)
+		assert report[0].created
+		assert repo.get_resource(resources[0].uri)
+		resources[0].delete()
+
+		# transactions do not nest
+		txn = repo.start_txn()
+		with pytest.raises(Exception) as excinfo:
+			txn.create_many([ BasicContainer(txn, '%s/bulk/txn/nested' % testing_container_uri) ], use_txn=True)
+		assert 'transactions do not nest' in str(excinfo.value)
+		txn.rollback()
+
+
+	def test_create_many_txn_not_started(self, http_requests):
+
+		# transaction not started, resources remain bound to repository
+		http_requests.fail('POST', 'fcr:tx', 503)
+		resources = [ BasicContainer(repo, '%s/bulk/txn/unstarted' % testing_container_uri) ]
+		with pytest.raises(Exception) as excinfo:
+			repo.create_many(resources, use_txn=True)
+		assert 'could not start transaction' in str(excinfo.value)
+		assert resources[0].repo is repo
+		assert not resources[0].exists
+
+
+
+# sharded ingest
+class TestShardedIngest(object):
+
+	def test_sharded_ingest(self):
+
+		# three trees, one failing
+		resources = []
+		for tree in ['x', 'y', 'z']:
+			resources.append(BasicContainer(repo, '%s/bulk/shards/%s' % (testing_container_uri, tree)))
+			resources.extend([ BasicContainer(repo, '%s/bulk/shards/%s/%s' % (testing_container_uri, tree, x)) for x in range(3) ])
+		resources[8].exists = True
+		report = repo.sharded_ingest(resources, shards=3, max_workers=2, retries=1)
+
+		# trees not split across shards
+		assert len(report) == 3
+		assert all([ len(shard.resources) == 4 for shard in report ])
+		assert sorted([ shard.committed for shard in report ]) == [False, True, True]
+		failed = [ shard for shard in report if not shard.committed ][0]
+		assert resources[8] in failed.resources
+		assert failed.attempts == 2
+		assert not repo.get_resource(resources[9].uri)
+		for shard in report:
+			if shard.committed:
+				assert shard.attempts == 1
+				assert shard.rate > 0
+				for resource in shard.resources:
+					assert repo.get_resource(resource.uri)
+
+
+
+# bulk updates
+class TestFlush(object):
+
+	def test_flush(self):
+
+		resources = repo._retrieve_resources([ '%s/bulk/txn/%s' % (testing_container_uri, x) for x in range(3) ])
+		assert not any([ resource.dirty for resource in resources ])
+
+		# modify two of three
+		for resource in resources[:2]:
+			resource.add_triple(resource.rdf.prefixes.dc.subject, 'flushed')
+		assert [ resource.dirty for resource in resources ] == [True, True, False]
+
+		# include resource not yet created
+		missing = BasicContainer(repo, '%s/bulk/txn/missing' % testing_container_uri)
+		report = repo.flush(resources + [missing], max_workers=2)
+		assert [ result.updated for result in report ] == [True, True, False, False]
+		assert [ result.skipped for result in report ] == [False, False, True, False]
+		assert report[3].error
+
+		# confirm
+		for resource in resources[:2]:
+			resource.refresh()
+			assert 'flushed' in [ str(o) for o in resource.rdf.triples.dc.subject ]
+			assert not resource.dirty
+
+
+	def test_create_many_then_flush(self):
+
+		# created without refresh, exist, and are not dirty
+		resources = [ BasicContainer(fast_repo, '%s/bulk/flushed/%s' % (testing_container_uri, x)) for x in range(3) ]
+		for resource in resources:
+			resource.add_triple(resource.rdf.prefixes.dc.subject, 'created')
+		report = fast_repo.create_many([ BasicContainer(fast_repo, '%s/bulk/flushed' % testing_container_uri) ] + resources)
+		assert all([ result.created for result in report ])
+		assert all([ resource.exists and not resource.dirty for resource in resources ])
+
+		# modified, and flushed, including removal of triple sent on create
+		for resource in resources:
+			resource.remove_triple(resource.rdf.prefixes.dc.subject, 'created')
+			resource.add_triple(resource.rdf.prefixes.dc.subject, 'flushed')
+		report = fast_repo.flush(resources)
+		assert all([ result.updated for result in report ])
+		for resource in resources:
+			subjects = [ str(o) for o in repo.get_resource(resource.uri).rdf.graph.objects(resource.uri, resource.rdf.prefixes.dc.subject) ]
+			assert subjects == ['flushed']
+
+
+	def test_flush_without_refresh(self, http_requests):
+
+		# fast_repo does not refresh after update
+		resource = fast_repo.get_resource('%s/bulk/txn/2' % testing_container_uri)
+		resource.add_triple(resource.rdf.prefixes.dc.subject, 'unrefreshed')
+		report = fast_repo.flush([resource])
+		assert report[0].updated
+		assert not resource.dirty
+		assert 'unrefreshed' in [ str(o) for o in repo.get_resource(resource.uri).rdf.graph.objects(resource.uri, resource.rdf.prefixes.dc.subject) ]
+
+		# second flush sends nothing
+		del http_requests[:]
+		report = fast_repo.flush([resource])
+		assert report[0].skipped
+		assert http_requests == []
+
+		# removing triple added and flushed is sent
+		resource.remove_triple(resource.rdf.prefixes.dc.subject, 'unrefreshed')
+		assert resource.dirty
+		resource.update()
+		assert [ verb for verb, uri in http_requests ] == ['PATCH']
+		assert 'unrefreshed' not in [ str(o) for o in repo.get_resource(resource.uri).rdf.graph.objects(resource.uri, resource.rdf.prefixes.dc.subject) ]
+
+
+
+# bulk deletion
+class TestDeleteMany(object):
+
+	def test_delete_many(self):
+
+		# descendants covered by ancestor, not reported as deleted
+		uris = [ '%s/bulk/%s' % (testing_container_uri, uri) for uri in ['a/b/c', 'a', 'd', 'missing', 'a/mistyped'] ]
+		report = repo.delete_many(uris, max_workers=2)
+		assert [ result.deleted for result in report ] == [False, True, True, False, False]
+		assert report[0].covered == repo.parse_uri(uris[1])
+		assert report[4].covered == repo.parse_uri(uris[1])
+		assert not any([ result.error for result in report ])
+		for uri in uris:
+			assert not repo.get_resource(uri)
+
+		# tombstones removed
+		a = BasicContainer(repo, uris[1])
+		a.create(specify_uri=True)
+		assert repo.get_resource(a.uri)
+
+		# throughput recorded
+		assert repo.delete_stats.resources == 2
+		assert repo.delete_stats.requests == 3
+		assert repo.delete_stats.rate > 0
+
+
+	def test_delete_many_tombstone_error(self, http_requests):
+
+		# tombstone removal fails
+		http_requests.fail('DELETE', 'fcr:tombstone', 500)
+		report = repo.delete_many(['%s/bulk/a' % testing_container_uri])
+		assert report[0].deleted
+		assert 'could not remove tombstone' in str(report[0].error)
+
+		# remove tombstone
+		del http_requests.failures[:]
+		repo.api.http_request('DELETE', '%s/fcr:tombstone' % repo.parse_uri('%s/bulk/a' % testing_container_uri))
+
+
+	def test_delete_tree(self):
+
+		# children only
+		txn = repo.get_resource('%s/bulk/txn' % testing_container_uri)
+		children = txn.children()
+		report = txn.delete_tree(include_self=False)
+		assert len(report) == len(children)
+		assert repo.get_resource(txn.uri).children() == []
+
+		# resource and beneath
+		bulk = repo.get_resource('%s/bulk' % testing_container_uri)
+		report = bulk.delete_tree()
+		assert report[0].deleted
+		assert not bulk.exists
+		assert not repo.get_resource('%s/bulk/h' % testing_container_uri)
+
+
+
+# HTTP sessions and connection pooling
+class TestSessions(object):
+
+	def test_session_reuse(self):
+
+		# repository session is reused across requests
+		session = repo.session
+		foo = repo.get_resource('%s/foo' % testing_container_uri)
+		assert foo.exists
+		assert repo.session is session
+
+		# transactions share session of repository
+		txn = repo.start_txn()
+		assert txn.session is repo.session
+
+		# closing transaction does not close shared session
+		txn.close()
+		txn.rollback()
+		assert repo.get_resource('%s/foo' % testing_container_uri).exists
+
+
+	def test_session_context_manager(self):
+
+		# repository as context manager closes session on exit
+		with Repository(
+			localsettings.REPO_ROOT,
+			localsettings.REPO_USERNAME,
+			localsettings.REPO_PASSWORD,
+			pool_maxsize=2,
+			keep_alive=False) as ctx_repo:
+			foo = ctx_repo.get_resource('%s/foo' % testing_container_uri)
+			assert foo.exists
+			assert ctx_repo.session.headers['Connection'] == 'close'
+
+
+
+# response cache
+class TestResponseCache(object):
+
+	def test_cache_revalidation(self):
+
+		cache_repo = Repository(
+			localsettings.REPO_ROOT,
+			localsettings.REPO_USERNAME,
+			localsettings.REPO_PASSWORD,
+			cache=True)
+
+		# first retrieval is a miss, second revalidates and is served from cache
+		foo = cache_repo.get_resource('%s/foo' % testing_container_uri)
+		assert cache_repo.cache.stats()['misses'] == 1
+		foo2 = cache_repo.get_resource('%s/foo' % testing_container_uri)
+		assert cache_repo.cache.stats()['hits'] == 1
+		assert type(foo2) == type(foo)
+		assert len(foo2.rdf.graph) == len(foo.rdf.graph)
+
+		# cached graph is a copy, local modifications do not leak into cache
+		foo2.add_triple(foo2.rdf.prefixes.dc.title, 'not cached')
+		foo3 = cache_repo.get_resource('%s/foo' % testing_container_uri)
+		assert len(foo3.rdf.graph) == len(foo.rdf.graph)
+
+		# update through repository invalidates cache
+		foo3.add_triple(foo3.rdf.prefixes.dc.title, 'cache invalidated')
+		foo3.update(auto_refresh=False)
+		assert cache_repo.cache.stats()['entries'] == 0
+		foo4 = cache_repo.get_resource('%s/foo' % testing_container_uri)
+		assert cache_repo.cache.stats()['misses'] == 2
+		assert (foo4.uri, foo4.rdf.prefixes.dc.title, rdflib.term.Literal('cache invalidated', datatype=rdflib.term.URIRef('http://www.w3.org/2001/XMLSchema#string'))) in foo4.rdf.graph
+
+		# cleanup
+		foo4.remove_triple(foo4.rdf.prefixes.dc.title, 'cache invalidated')
+		foo4.update(auto_refresh=False)
+
+
+	def test_cache_eviction(self):
+
+		cache_repo = Repository(
+			localsettings.REPO_ROOT,
+			localsettings.REPO_USERNAME,
+			localsettings.REPO_PASSWORD,
+			cache=True,
+			cache_max_triples=1)
+
+		# graphs larger than cache are not cached
+		cache_repo.get_resource('%s/foo' % testing_container_uri)
+		assert cache_repo.cache.stats()['entries'] == 0
+
+
+	def test_cache_lru_eviction(self):
+
+		# number of triples of each resource
+		uris = [ '%s' % testing_container_uri, '%s/foo' % testing_container_uri, '%s/foo/bar' % testing_container_uri ]
+		weights = [ len(repo.get_resource(uri).rdf.graph) for uri in uris ]
+
+		# room for first two resources, or first and third, but not all three
+		cache_repo = Repository(
+			localsettings.REPO_ROOT,
+			localsettings.REPO_USERNAME,
+			localsettings.REPO_PASSWORD,
+			cache=True,
+			cache_max_triples=weights[0] + max(weights[1], weights[2]))
+		cached_uris = lambda: [ uri for uri, serialization in cache_repo.cache.entries ]
+
+		# retrieve first two, then first again, leaving second least recently used
+		first = cache_repo.get_resource(uris[0])
+		second = cache_repo.get_resource(uris[1])
+		cache_repo.get_resource(uris[0])
+		assert cache_repo.cache.stats()['evictions'] == 0
+
+		# third evicts second
+		third = cache_repo.get_resource(uris[2])
+		assert cache_repo.cache.stats()['evictions'] == 1
+		assert cached_uris() == [str(first.uri), str(third.uri)]
+		assert cache_repo.cache.graph(second.uri, second.headers) is None
+		assert len(cache_repo.cache.graph(third.uri, third.headers)) == weights[2]
+
+
+
+# asyncio repository
+class TestAsyncRepository(object):
+
+	def test_async_crud(self):
+
+		async def crud():
+			async with AsyncRepository(repo, concurrency=4) as arepo:
+
+				# create
+				ahoy = BasicContainer(repo, '%s/ahoy' % testing_container_uri)
+				await arepo.create(ahoy, specify_uri=True)
+				assert ahoy.exists
+
+				# create children concurrently
+				children = [ BasicContainer(repo, '%s/ahoy/child%s' % (testing_container_uri, x)) for x in range(5) ]
+				await asyncio.gather(*[ arepo.create(child, specify_uri=True) for child in children ])
+
+				# get, update, refresh
+				ahoy = await arepo.get_resource(ahoy.uri)
+				assert type(ahoy) == BasicContainer
+				ahoy.add_triple(ahoy.rdf.prefixes.dc.title, 'ahoy there')
+				await arepo.update(ahoy)
+				await arepo.refresh(ahoy)
+				assert ahoy.rdf.triples.dc.title[0].toPython() == 'ahoy there'
+
+				# iterate children as resources
+				retrieved = [ child async for child in arepo.children(ahoy, as_resources=True) ]
+				assert len(retrieved) == 5
+				assert all([ type(child) == BasicContainer for child in retrieved ])
+
+				# children retrieved with bounded window, remaining requests not issued when iteration stops early
+				async with AsyncRepository(repo, concurrency=1) as bounded:
+					started = []
+					get_resource = bounded.get_resource
+					async def counting_get_resource(uri, **kwargs):
+						started.append(uri)
+						return await get_resource(uri, **kwargs)
+					bounded.get_resource = counting_get_resource
+					iterator = bounded.children(ahoy, as_resources=True)
+					assert type(await iterator.__anext__()) == BasicContainer
+					await iterator.aclose()
+					assert len(started) == 2
+
+				# delete
+				await arepo.delete(ahoy)
+				assert not await arepo.get_resource(ahoy.uri)
+
+		asyncio.run(crud())
+
+
 
 ########################################################
 # TEARDOWN